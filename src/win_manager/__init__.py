@@ -5,11 +5,7 @@ This package provides intelligent window management capabilities for Windows,
 including automatic layout organization, window detection, and configuration management.
 """
 
-from .core.window_manager import WindowManager
-from .core.window_detector import WindowDetector, WindowInfo
-from .core.window_controller import WindowController
-from .core.layout_manager import LayoutEngine
-from .core.config_manager import ConfigManager
+from importlib import import_module
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
@@ -23,4 +19,28 @@ __all__ = [
     "LayoutEngine",
     "ConfigManager",
     "__version__"
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package does not pull in pywin32/psutil until they are actually needed.
+_LAZY_IMPORTS = {
+    "WindowManager": ".core.window_manager",
+    "WindowDetector": ".core.window_detector",
+    "WindowInfo": ".core.window_detector",
+    "WindowController": ".core.window_controller",
+    "LayoutEngine": ".core.layout_manager",
+    "ConfigManager": ".core.config_manager",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,12 +6,14 @@ import sys
 import os
 from typing import Optional
 
-# 添加src路径以便导入模块
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+from ..utils.validation import validate_config_key, validate_file_path, CONFIG_TARGET_CHOICE
+from ..utils.helpers import get_error_message, confirm_action, get_cli_config, get_core_config
 
-from win_manager.core.config_manager import ConfigManager
-from ..utils.validation import validate_config_key, validate_file_path
-from ..utils.helpers import get_error_message, confirm_action
+# 可选依赖 orjson（C 实现，直接生成 UTF-8），不可用时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @click.group()
@@ -32,10 +34,10 @@ def show(ctx, key: Optional[str], section: Optional[str]):
         output.info("显示配置")
         
         # 获取CLI配置
-        cli_config = ctx.obj['cli_config']
+        cli_config = get_cli_config(ctx)
         
-        # 创建核心配置管理器
-        core_config = ConfigManager()
+        # 获取核心配置管理器
+        core_config = get_core_config(ctx)
         
         if key:
             # 显示特定配置项
@@ -77,7 +79,7 @@ def show(ctx, key: Optional[str], section: Optional[str]):
 @config.command()
 @click.argument('key', callback=validate_config_key)
 @click.argument('value')
-@click.option('--target', type=click.Choice(['cli', 'core', 'both']), default='both',
+@click.option('--target', type=CONFIG_TARGET_CHOICE, default='both',
               help='设置目标配置')
 @click.pass_context
 def set(ctx, key: str, value: str, target: str):
@@ -104,12 +106,12 @@ def set(ctx, key: str, value: str, target: str):
         
         # 设置配置
         if target in ['cli', 'both']:
-            cli_config = ctx.obj['cli_config']
+            cli_config = get_cli_config(ctx)
             cli_config.set(key, parsed_value)
             cli_config.save()
         
         if target in ['core', 'both']:
-            core_config = ConfigManager()
+            core_config = get_core_config(ctx)
             core_config.set(key, parsed_value)
             core_config.save_config()
         
@@ -127,7 +129,7 @@ def set(ctx, key: str, value: str, target: str):
 
 @config.command()
 @click.argument('key', callback=validate_config_key)
-@click.option('--target', type=click.Choice(['cli', 'core', 'both']), default='both',
+@click.option('--target', type=CONFIG_TARGET_CHOICE, default='both',
               help='获取目标配置')
 @click.pass_context
 def get(ctx, key: str, target: str):
@@ -140,11 +142,11 @@ def get(ctx, key: str, target: str):
         result_data = {'key': key}
         
         if target in ['cli', 'both']:
-            cli_config = ctx.obj['cli_config']
+            cli_config = get_cli_config(ctx)
             result_data['cli_value'] = cli_config.get(key)
         
         if target in ['core', 'both']:
-            core_config = ConfigManager()
+            core_config = get_core_config(ctx)
             result_data['core_value'] = core_config.get(key)
         
         output.print(result_data, f"配置值: {key}")
@@ -156,7 +158,7 @@ def get(ctx, key: str, target: str):
 
 @config.command()
 @click.option('--key', callback=validate_config_key, help='重置特定配置项')
-@click.option('--target', type=click.Choice(['cli', 'core', 'both']), default='both',
+@click.option('--target', type=CONFIG_TARGET_CHOICE, default='both',
               help='重置目标配置')
 @click.option('--confirm', is_flag=True, help='确认重置')
 @click.pass_context
@@ -191,7 +193,7 @@ def reset(ctx, key: Optional[str], target: str, confirm: bool):
         
         # 重置配置
         if target in ['cli', 'both']:
-            cli_config = ctx.obj['cli_config']
+            cli_config = get_cli_config(ctx)
             if key:
                 # 重置特定配置项（设置为默认值）
                 cli_config.set(key, None)
@@ -201,14 +203,14 @@ def reset(ctx, key: Optional[str], target: str, confirm: bool):
                 cli_config.reset()
         
         if target in ['core', 'both']:
-            core_config = ConfigManager()
+            core_config = get_core_config(ctx)
             if key:
                 # 重置特定配置项
                 core_config.set(key, None)
-                core_config.save_config()
             else:
                 # 重置所有配置
-                core_config.reset_config()
+                core_config.reset_to_default()
+            core_config.save_config()
         
         result_data = {
             'key': key,
@@ -226,7 +228,7 @@ def reset(ctx, key: Optional[str], target: str, confirm: bool):
 @click.argument('path', callback=validate_file_path)
 @click.option('--format', type=click.Choice(['json', 'yaml']), default='yaml',
               help='导出格式')
-@click.option('--target', type=click.Choice(['cli', 'core', 'both']), default='both',
+@click.option('--target', type=CONFIG_TARGET_CHOICE, default='both',
               help='导出目标配置')
 @click.pass_context
 def export(ctx, path: str, format: str, target: str):
@@ -252,28 +254,39 @@ def export(ctx, path: str, format: str, target: str):
         export_data = {}
         
         if target in ['cli', 'both']:
-            cli_config = ctx.obj['cli_config']
+            cli_config = get_cli_config(ctx)
             export_data['cli_config'] = cli_config.config
         
         if target in ['core', 'both']:
-            core_config = ConfigManager()
+            core_config = get_core_config(ctx)
             export_data['core_config'] = core_config.config
         
         # 导出配置
         if format == 'json':
-            import json
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson 直接生成 UTF-8 字节，无需中间字符串
+                with open(path, 'wb') as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+                    size = f.tell()
+            else:
+                import json
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                    size = f.tell()
         else:  # yaml
             import yaml
+            # 优先使用 libyaml 的 C 实现
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
             with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(export_data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(export_data, f, Dumper=dumper,
+                          default_flow_style=False, allow_unicode=True)
+                size = f.tell()
         
         result_data = {
             'path': path,
             'format': format,
             'target': target,
-            'size': os.path.getsize(path)
+            'size': size
         }
         output.print(result_data, f"配置导出成功: {path}")
         
@@ -284,7 +297,7 @@ def export(ctx, path: str, format: str, target: str):
 
 @config.command()
 @click.argument('path', callback=validate_file_path)
-@click.option('--target', type=click.Choice(['cli', 'core', 'both']), default='both',
+@click.option('--target', type=CONFIG_TARGET_CHOICE, default='both',
               help='导入目标配置')
 @click.pass_context
 def import_config(ctx, path: str, target: str):
@@ -305,26 +318,19 @@ def import_config(ctx, path: str, target: str):
             output.print(result_data, f"将导入配置从: {path}")
             return
         
-        # 读取配置文件
-        if path.endswith('.json'):
-            import json
-            with open(path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
-        else:  # yaml
-            import yaml
-            with open(path, 'r', encoding='utf-8') as f:
-                import_data = yaml.safe_load(f)
+        # 读取配置文件（按扩展名选择解析器，未知扩展名按 YAML 处理）
+        ext = os.path.splitext(path)[1].lower()
+        import_data = _LOADERS.get(ext, _load_yaml)(path)
         
         # 导入配置
         if target in ['cli', 'both'] and 'cli_config' in import_data:
-            cli_config = ctx.obj['cli_config']
+            cli_config = get_cli_config(ctx)
             cli_config.config.update(import_data['cli_config'])
             cli_config.save()
         
         if target in ['core', 'both'] and 'core_config' in import_data:
-            core_config = ConfigManager()
-            for key, value in import_data['core_config'].items():
-                core_config.set(key, value)
+            core_config = get_core_config(ctx)
+            core_config.update(import_data['core_config'])
             core_config.save_config()
         
         result_data = {
@@ -339,23 +345,70 @@ def import_config(ctx, path: str, target: str):
         sys.exit(1)
 
 
+def _load_json(path: str):
+    """读取 JSON 配置文件"""
+    import json
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_yaml(path: str):
+    """读取 YAML 配置文件"""
+    import yaml
+    # 优先使用 libyaml 的 C 实现
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _load_toml(path: str):
+    """读取 TOML 配置文件"""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+_LOADERS = {
+    '.json': _load_json,
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.toml': _load_toml,
+}
+
+
+_BOOL_VALUES = {'true': True, 'false': False}
+# float() 接受的非数字开头的特殊值（可带正负号）
+_FLOAT_WORDS = frozenset(('inf', 'infinity', 'nan'))
+
+
 def _parse_config_value(value: str):
     """解析配置值"""
     # 尝试解析为布尔值
-    if value.lower() in ['true', 'false']:
-        return value.lower() == 'true'
+    lowered = value.lower()
+    if lowered in _BOOL_VALUES:
+        return _BOOL_VALUES[lowered]
     
-    # 尝试解析为整数
-    try:
-        return int(value)
-    except ValueError:
-        pass
-    
-    # 尝试解析为浮点数
-    try:
-        return float(value)
-    except ValueError:
-        pass
+    # 按首字符判断是否可能是数字，避免普通字符串走异常路径；
+    # 可能是数字时仍交给 int()/float()，保留空白、下划线、inf/nan 等写法
+    stripped = value.strip()
+    first = stripped[:1]
+    if first and (first in '+-.' or first.isdecimal()
+                  or stripped.lstrip('+-').lower() in _FLOAT_WORDS):
+        digits = stripped[1:] if first in '+-' else stripped
+        if digits.isdecimal():
+            return int(stripped)
+        
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            pass
     
     # 尝试解析为列表（逗号分隔）
     if ',' in value:
@@ -363,9 +416,3 @@ def _parse_config_value(value: str):
     
     # 默认返回字符串
     return value
-
-
-# 注册命令到主CLI
-def register_config_commands(cli_group):
-    """注册配置命令到主CLI"""
-    cli_group.add_command(config)
\ No newline at end of file
@@ -3,15 +3,10 @@ Hotkey management commands
 """
 import click
 import sys
-import os
 from typing import Optional
 
-# 添加src路径以便导入模块
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
-
-from win_manager.utils.hotkey_manager import HotkeyManager
 from ..utils.validation import validate_hotkey_combination, validate_window_target
-from ..utils.helpers import get_error_message
+from ..utils.helpers import get_error_message, get_hotkey_manager
 
 
 @click.group()
@@ -29,8 +24,8 @@ def list(ctx):
         
         output.info("列出已注册的热键")
         
-        # 创建热键管理器
-        hotkey_manager = HotkeyManager()
+        # 获取热键管理器
+        hotkey_manager = get_hotkey_manager(ctx)
         
         # 获取已注册的热键
         registered_hotkeys = hotkey_manager.get_registered_hotkeys()
@@ -77,8 +72,8 @@ def add(ctx, key_combination: str, action: str, description: Optional[str], targ
             output.print(result_data, f"将添加热键: {key_combination}")
             return
         
-        # 创建热键管理器
-        hotkey_manager = HotkeyManager()
+        # 获取热键管理器
+        hotkey_manager = get_hotkey_manager(ctx)
         
         # 创建热键回调函数
         def hotkey_callback():
@@ -128,8 +123,8 @@ def remove(ctx, key_combination: str):
             output.print(result_data, f"将移除热键: {key_combination}")
             return
         
-        # 创建热键管理器
-        hotkey_manager = HotkeyManager()
+        # 获取热键管理器
+        hotkey_manager = get_hotkey_manager(ctx)
         
         # 移除热键
         success = hotkey_manager.unregister_hotkey(key_combination)
@@ -169,8 +164,8 @@ def start(ctx):
             output.print(result_data, "将启动热键监听")
             return
         
-        # 创建热键管理器
-        hotkey_manager = HotkeyManager()
+        # 获取热键管理器
+        hotkey_manager = get_hotkey_manager(ctx)
         
         # 启动热键监听
         success = hotkey_manager.start()
@@ -229,8 +224,8 @@ def stop(ctx):
             output.print(result_data, "将停止热键监听")
             return
         
-        # 创建热键管理器
-        hotkey_manager = HotkeyManager()
+        # 获取热键管理器
+        hotkey_manager = get_hotkey_manager(ctx)
         
         # 停止热键监听
         success = hotkey_manager.stop()
@@ -296,9 +291,3 @@ def _execute_hotkey_action(action: str, target: Optional[str], output):
             
     except Exception as e:
         output.error(f"执行热键动作失败: {get_error_message(e)}")
-
-
-# 注册命令到主CLI
-def register_hotkey_commands(cli_group):
-    """注册热键命令到主CLI"""
-    cli_group.add_command(hotkey)
\ No newline at end of file
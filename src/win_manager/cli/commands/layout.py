@@ -2,17 +2,14 @@
 Layout management commands
 """
 import click
+import re
 import sys
-import os
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict
 
-# 添加src路径以便导入模块
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
-
-from win_manager.core.window_manager import WindowManager
 from ..utils.validation import (
     validate_layout_type, validate_window_target, validate_positive_integer,
-    validate_non_negative_integer, validate_stack_position, DIMENSION_TYPE
+    validate_non_negative_integer, validate_stack_position, DIMENSION_TYPE,
+    STACK_POSITION_CHOICE
 )
 from ..utils.helpers import get_error_message
 
@@ -37,7 +34,7 @@ def layout():
               help='瀑布布局 X 偏移')
 @click.option('--offset-y', type=int, callback=validate_non_negative_integer,
               help='瀑布布局 Y 偏移')
-@click.option('--stack-position', type=click.Choice(['center', 'left', 'right']),
+@click.option('--stack-position', type=STACK_POSITION_CHOICE,
               callback=validate_stack_position, help='堆叠位置')
 @click.option('--window-width', type=DIMENSION_TYPE,
               help='窗口宽度 (像素值如800或百分比如50%)')
@@ -54,57 +51,41 @@ def apply(ctx, layout_type: str, target: tuple, exclude: tuple, columns: Optiona
         
         output.info(f"应用布局: {layout_type}")
         
+        # 全部布局选项（未指定的为 None，用于结果输出）
+        options = {
+            'columns': columns,
+            'padding': padding,
+            'offset_x': offset_x,
+            'offset_y': offset_y,
+            'stack_position': stack_position,
+            'window_width': window_width,
+            'window_height': window_height
+        }
+        # 只传递用户指定的选项
+        layout_options = {name: value for name, value in options.items() if value is not None}
+        
         if dry_run:
             output.info("模拟运行模式 - 不实际执行操作")
-            result_data = {
-                'layout_type': layout_type,
-                'target_filters': list(target) if target else [],
-                'exclude_filters': list(exclude) if exclude else [],
-                'options': {
-                    'columns': columns,
-                    'padding': padding,
-                    'offset_x': offset_x,
-                    'offset_y': offset_y,
-                    'stack_position': stack_position,
-                    'window_width': window_width,
-                    'window_height': window_height
-                },
-                'dry_run': True
-            }
+            result_data = _build_result(target, exclude, options,
+                                        layout_type=layout_type, dry_run=True)
             output.print(result_data, f"将应用 {layout_type} 布局")
             return
         
+        from win_manager.core.window_manager import WindowManager
+        
         # 创建窗口管理器
         manager = WindowManager()
         
         # 获取可管理的窗口
         windows = manager.get_manageable_windows()
         
-        # 应用过滤器
-        if target:
-            # 过滤目标窗口
-            filtered_windows = []
-            for window in windows:
-                for target_filter in target:
-                    if (target_filter.lower() in window.title.lower() or 
-                        target_filter.lower() in window.process_name.lower()):
-                        filtered_windows.append(window)
-                        break
-            windows = filtered_windows
+        # 应用过滤器（过滤条件只做一次大小写折叠和编译）
+        target_match = _build_matcher(target)
+        exclude_match = _build_matcher(exclude)
         
-        if exclude:
-            # 排除窗口
-            filtered_windows = []
-            for window in windows:
-                should_exclude = False
-                for exclude_filter in exclude:
-                    if (exclude_filter.lower() in window.title.lower() or 
-                        exclude_filter.lower() in window.process_name.lower()):
-                        should_exclude = True
-                        break
-                if not should_exclude:
-                    filtered_windows.append(window)
-            windows = filtered_windows
+        if target_match or exclude_match:
+            # 一次遍历同时应用目标过滤和排除过滤
+            windows = [w for w in windows if _passes_filters(w, target_match, exclude_match)]
         
         if not windows:
             output.warning("没有找到可管理的窗口")
@@ -115,41 +96,12 @@ def apply(ctx, layout_type: str, target: tuple, exclude: tuple, columns: Optiona
             output.print(result_data, "没有窗口可以应用布局")
             return
         
-        # 应用布局
-        layout_options = {}
-        if columns is not None:
-            layout_options['columns'] = columns
-        if padding is not None:
-            layout_options['padding'] = padding
-        if offset_x is not None:
-            layout_options['offset_x'] = offset_x
-        if offset_y is not None:
-            layout_options['offset_y'] = offset_y
-        if stack_position is not None:
-            layout_options['stack_position'] = stack_position
-        if window_width is not None:
-            layout_options['window_width'] = window_width
-        if window_height is not None:
-            layout_options['window_height'] = window_height
-        
         success = manager.organize_windows(layout_type, **layout_options)
         
         if success:
-            result_data = {
-                'windows_processed': len(windows),
-                'layout_applied': layout_type,
-                'target_filters': list(target) if target else [],
-                'exclude_filters': list(exclude) if exclude else [],
-                'options': {
-                    'columns': columns,
-                    'padding': padding,
-                    'offset_x': offset_x,
-                    'offset_y': offset_y,
-                    'stack_position': stack_position,
-                    'window_width': window_width,
-                    'window_height': window_height
-                }
-            }
+            result_data = _build_result(target, exclude, options,
+                                        windows_processed=len(windows),
+                                        layout_applied=layout_type)
             output.print(result_data, f"{layout_type} 布局应用成功")
         else:
             output.error(f"{layout_type} 布局应用失败")
@@ -175,6 +127,8 @@ def undo(ctx):
             output.print({'action': 'undo_layout', 'dry_run': True}, "将撤销上一次布局")
             return
         
+        from win_manager.core.window_manager import WindowManager
+        
         # 创建窗口管理器
         manager = WindowManager()
         
@@ -238,39 +192,71 @@ def list(ctx):
         
         output.info("列出可用布局")
         
+        from win_manager.core.window_manager import WindowManager
+        
         # 创建窗口管理器
         manager = WindowManager()
         
         # 获取可用布局
         layouts = manager.get_available_layouts()
         
-        # 格式化布局信息
-        layout_info = []
-        for layout in layouts:
-            layout_info.append({
+        # 格式化布局信息（逐项生成并输出）
+        layout_info = (
+            {
                 'name': layout,
                 'description': _get_layout_description(layout),
                 'type': 'built-in'
-            })
+            }
+            for layout in layouts
+        )
         
-        output.print(layout_info, f"找到 {len(layouts)} 个可用布局")
+        output.print_stream(layout_info, f"找到 {len(layouts)} 个可用布局")
         
     except Exception as e:
         output.error(get_error_message(e))
         sys.exit(1)
 
 
-def _get_layout_description(layout_name: str) -> str:
-    """获取布局描述"""
-    descriptions = {
-        'cascade': '瀑布布局 - 窗口呈阶梯状排列',
-        'grid': '网格布局 - 窗口均匀分布在屏幕上',
-        'stack': '堆叠布局 - 窗口重叠排列在中心位置'
+def _build_result(target: tuple, exclude: tuple, options: Dict, **extra) -> Dict:
+    """构建布局命令的结果数据"""
+    return {
+        **extra,
+        'target_filters': [*target],
+        'exclude_filters': [*exclude],
+        'options': options
     }
-    return descriptions.get(layout_name, '未知布局')
 
 
-# 注册命令到主CLI
-def register_layout_commands(cli_group):
-    """注册布局命令到主CLI"""
-    cli_group.add_command(layout)
\ No newline at end of file
+def _build_matcher(terms) -> Optional[Callable[[str], bool]]:
+    """将过滤条件编译为子串匹配函数，未指定条件时返回 None
+
+    条件较多时合并为一个正则交替式，由 re 在 C 层一次扫描完成匹配。
+    """
+    terms_cf = tuple(t.casefold() for t in terms)
+    if not terms_cf:
+        return None
+    if len(terms_cf) <= 2:
+        return lambda text: any(t in text for t in terms_cf)
+    pattern = re.compile('|'.join(map(re.escape, terms_cf)))
+    return lambda text: pattern.search(text) is not None
+
+
+def _passes_filters(window, target_match, exclude_match) -> bool:
+    """窗口是否匹配目标条件（未指定时视为匹配）且不匹配排除条件"""
+    title_cf = window.title.casefold()
+    proc_cf = window.process_name.casefold()
+    if target_match and not (target_match(title_cf) or target_match(proc_cf)):
+        return False
+    return not (exclude_match and (exclude_match(title_cf) or exclude_match(proc_cf)))
+
+
+_LAYOUT_DESCRIPTIONS = {
+    'cascade': '瀑布布局 - 窗口呈阶梯状排列',
+    'grid': '网格布局 - 窗口均匀分布在屏幕上',
+    'stack': '堆叠布局 - 窗口重叠排列在中心位置'
+}
+
+
+def _get_layout_description(layout_name: str) -> str:
+    """获取布局描述"""
+    return _LAYOUT_DESCRIPTIONS.get(layout_name, '未知布局')
@@ -2,21 +2,15 @@
 Tool commands for system management and testing
 """
 import click
+import importlib
 import sys
-import os
 import time
-import psutil
+import tracemalloc
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import Optional
 
-# 添加src路径以便导入模块
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
-
-from win_manager.core.window_manager import WindowManager
-from win_manager.core.window_detector import WindowDetector
-from win_manager.core.window_controller import WindowController
-from win_manager.core.layout_manager import LayoutEngine
-from win_manager.core.config_manager import ConfigManager
-from win_manager.utils.hotkey_manager import HotkeyManager
 from ..utils.validation import validate_component_name, validate_positive_integer
 from ..utils.helpers import get_error_message, format_duration, format_bytes
 
@@ -36,15 +30,18 @@ def status(ctx):
         
         output.info("获取系统状态")
         
+        import psutil
+        
         # 收集系统信息
+        memory = psutil.virtual_memory()
         status_data = {
             'system': {
                 'platform': sys.platform,
                 'python_version': sys.version.split()[0],
                 'cpu_count': psutil.cpu_count(),
-                'memory_total': format_bytes(psutil.virtual_memory().total),
-                'memory_available': format_bytes(psutil.virtual_memory().available),
-                'memory_percent': psutil.virtual_memory().percent
+                'memory_total': format_bytes(memory.total),
+                'memory_available': format_bytes(memory.available),
+                'memory_percent': memory.percent
             },
             'win_manager': {
                 'version': '0.1.0',
@@ -53,69 +50,15 @@ def status(ctx):
             }
         }
         
-        # 检查各个组件状态
-        try:
-            detector = WindowDetector()
-            windows = detector.enumerate_windows()
-            status_data['win_manager']['components']['detector'] = {
-                'status': 'ok',
-                'windows_found': len(windows)
-            }
-        except Exception as e:
-            status_data['win_manager']['components']['detector'] = {
-                'status': 'error',
-                'error': str(e)
-            }
-        
-        try:
-            controller = WindowController()
-            status_data['win_manager']['components']['controller'] = {
-                'status': 'ok'
-            }
-        except Exception as e:
-            status_data['win_manager']['components']['controller'] = {
-                'status': 'error',
-                'error': str(e)
-            }
-        
-        try:
-            layout_engine = LayoutEngine()
-            layouts = layout_engine.get_available_layouts()
-            status_data['win_manager']['components']['layout_engine'] = {
-                'status': 'ok',
-                'available_layouts': layouts
-            }
-        except Exception as e:
-            status_data['win_manager']['components']['layout_engine'] = {
-                'status': 'error',
-                'error': str(e)
-            }
-        
-        try:
-            config_manager = ConfigManager()
-            status_data['win_manager']['components']['config_manager'] = {
-                'status': 'ok',
-                'config_loaded': config_manager.config is not None
-            }
-        except Exception as e:
-            status_data['win_manager']['components']['config_manager'] = {
-                'status': 'error',
-                'error': str(e)
-            }
-        
-        try:
-            hotkey_manager = HotkeyManager()
-            registered_hotkeys = hotkey_manager.get_registered_hotkeys()
-            status_data['win_manager']['components']['hotkey_manager'] = {
-                'status': 'ok',
-                'registered_hotkeys': len(registered_hotkeys),
-                'hotkeys': registered_hotkeys
-            }
-        except Exception as e:
-            status_data['win_manager']['components']['hotkey_manager'] = {
-                'status': 'error',
-                'error': str(e)
+        # 并发检查各个组件状态（各项检查相互独立，主要耗时在系统调用上）
+        components = status_data['win_manager']['components']
+        with ThreadPoolExecutor(max_workers=len(_STATUS_CHECKS)) as executor:
+            futures = {
+                name: executor.submit(_run_status_check, module_name, class_name, probe)
+                for name, module_name, class_name, probe in _STATUS_CHECKS
             }
+        for name, future in futures.items():
+            components[name] = future.result()
         
         output.print(status_data, "系统状态")
         
@@ -124,6 +67,39 @@ def status(ctx):
         sys.exit(1)
 
 
+def _probe_hotkey_manager(hotkey_manager) -> dict:
+    """热键管理器状态"""
+    registered_hotkeys = hotkey_manager.get_registered_hotkeys()
+    return {
+        'registered_hotkeys': len(registered_hotkeys),
+        'hotkeys': registered_hotkeys
+    }
+
+
+# 组件状态检查表: (组件名, 模块, 类名, 探测函数)
+_STATUS_CHECKS = (
+    ('detector', 'win_manager.core.window_detector', 'WindowDetector',
+     lambda detector: {'windows_found': len(detector.enumerate_windows())}),
+    ('controller', 'win_manager.core.window_controller', 'WindowController',
+     lambda controller: {}),
+    ('layout_engine', 'win_manager.core.layout_manager', 'LayoutEngine',
+     lambda engine: {'available_layouts': engine.get_available_layouts()}),
+    ('config_manager', 'win_manager.core.config_manager', 'ConfigManager',
+     lambda config: {'config_loaded': config.config is not None}),
+    ('hotkey_manager', 'win_manager.utils.hotkey_manager', 'HotkeyManager',
+     _probe_hotkey_manager),
+)
+
+
+def _run_status_check(module_name: str, class_name: str, probe) -> dict:
+    """创建组件并探测状态，失败时返回错误信息"""
+    try:
+        component_cls = getattr(importlib.import_module(module_name), class_name)
+        return {'status': 'ok', **probe(component_cls())}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+
+
 @tool.command()
 @click.option('--component', type=click.Choice(['detector', 'controller', 'layout', 'config', 'hotkey', 'all']),
               default='all', callback=validate_component_name, help='测试特定组件')
@@ -245,9 +221,12 @@ def _test_detector(verbose: bool, output) -> dict:
     if verbose:
         output.info("测试窗口检测器...")
     
+    from win_manager.core.window_detector import WindowDetector
+    
     results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
     
     # 测试1: 创建检测器
+    detector = None
     results['total'] += 1
     try:
         detector = WindowDetector()
@@ -263,7 +242,9 @@ def _test_detector(verbose: bool, output) -> dict:
     # 测试2: 枚举窗口
     results['total'] += 1
     try:
-        detector = WindowDetector()
+        # 复用测试1创建的检测器
+        if detector is None:
+            detector = WindowDetector()
         windows = detector.enumerate_windows()
         if isinstance(windows, list):
             results['passed'] += 1
@@ -288,6 +269,8 @@ def _test_controller(verbose: bool, output) -> dict:
     if verbose:
         output.info("测试窗口控制器...")
     
+    from win_manager.core.window_controller import WindowController
+    
     results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
     
     # 测试1: 创建控制器
@@ -311,9 +294,12 @@ def _test_layout_engine(verbose: bool, output) -> dict:
     if verbose:
         output.info("测试布局引擎...")
     
+    from win_manager.core.layout_manager import LayoutEngine
+    
     results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
     
     # 测试1: 创建布局引擎
+    layout_engine = None
     results['total'] += 1
     try:
         layout_engine = LayoutEngine()
@@ -329,7 +315,9 @@ def _test_layout_engine(verbose: bool, output) -> dict:
     # 测试2: 获取可用布局
     results['total'] += 1
     try:
-        layout_engine = LayoutEngine()
+        # 复用测试1创建的布局引擎
+        if layout_engine is None:
+            layout_engine = LayoutEngine()
         layouts = layout_engine.get_available_layouts()
         if isinstance(layouts, list) and len(layouts) > 0:
             results['passed'] += 1
@@ -354,6 +342,8 @@ def _test_config_manager(verbose: bool, output) -> dict:
     if verbose:
         output.info("测试配置管理器...")
     
+    from win_manager.core.config_manager import ConfigManager
+    
     results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
     
     # 测试1: 创建配置管理器
@@ -377,6 +367,8 @@ def _test_hotkey_manager(verbose: bool, output) -> dict:
     if verbose:
         output.info("测试热键管理器...")
     
+    from win_manager.utils.hotkey_manager import HotkeyManager
+    
     results = {'total': 0, 'passed': 0, 'failed': 0, 'errors': []}
     
     # 测试1: 创建热键管理器
@@ -395,9 +387,44 @@ def _test_hotkey_manager(verbose: bool, output) -> dict:
     return results
 
 
+def _summarize_times(times_ns) -> dict:
+    """汇总纳秒计时结果，只在输出时换算为秒"""
+    total = sum(times_ns)
+    return {
+        'average_time': format_duration(total / len(times_ns) / 1e9),
+        'min_time': format_duration(min(times_ns) / 1e9),
+        'max_time': format_duration(max(times_ns) / 1e9),
+        'total_time': format_duration(total / 1e9)
+    }
+
+
+def _simulated_rect(j: int) -> tuple:
+    """模拟窗口的位置矩形"""
+    x = j * 10
+    return (x, x, x + 800, x + 600)
+
+
+def _simulated_windows(count: int) -> list:
+    """按列构造基准测试用的模拟窗口列表"""
+    from win_manager.core.window_detector import WindowInfo
+    
+    indices = range(count)
+    return list(map(
+        WindowInfo,
+        indices,
+        map("Window {}".format, indices),
+        map("app{}.exe".format, indices),
+        range(100, 100 + count),
+        map(_simulated_rect, indices),
+        repeat(True, count),
+        repeat(True, count),
+    ))
+
+
 def _run_benchmark(windows: int, iterations: int, output) -> dict:
     """运行性能基准测试"""
-    from win_manager.core.window_detector import WindowInfo
+    from win_manager.core.window_detector import WindowDetector
+    from win_manager.core.layout_manager import LayoutEngine
     
     results = {
         'parameters': {
@@ -407,82 +434,68 @@ def _run_benchmark(windows: int, iterations: int, output) -> dict:
         'results': {}
     }
     
-    # 基准测试1: 窗口检测性能
+    # 模拟窗口只构造一次，不计入各项计时
+    simulated_windows = _simulated_windows(windows)
+    
+    # 基准测试1: 窗口检测性能（枚举当前系统窗口）
     output.progress("测试窗口检测性能...")
     
+    # 非详细模式下不输出进度，循环内无需构造进度消息
+    report_progress = output.should_emit('verbose')
+    
     detector = WindowDetector()
-    detection_times = []
+    detection_times = array('q', [0]) * iterations
     
     for i in range(iterations):
-        start_time = time.time()
-        # 模拟窗口检测
-        simulated_windows = [
-            WindowInfo(j, f"Window {j}", f"app{j}.exe", 100+j, 
-                      (j*10, j*10, j*10+800, j*10+600), True, True)
-            for j in range(windows)
-        ]
-        end_time = time.time()
-        detection_times.append(end_time - start_time)
-    
-    results['results']['window_detection'] = {
-        'average_time': format_duration(sum(detection_times) / len(detection_times)),
-        'min_time': format_duration(min(detection_times)),
-        'max_time': format_duration(max(detection_times)),
-        'total_time': format_duration(sum(detection_times))
-    }
+        start_time = time.perf_counter_ns()
+        detector.enumerate_windows()
+        detection_times[i] = time.perf_counter_ns() - start_time
+        # 每 64 次迭代报告一次进度，且放在计时区间之外
+        if report_progress and (i & 63) == 63:
+            output.progress(f"窗口检测 {i + 1}/{iterations}")
+    
+    results['results']['window_detection'] = _summarize_times(detection_times)
     
     # 基准测试2: 布局计算性能
     output.progress("测试布局计算性能...")
     
     layout_engine = LayoutEngine()
-    layout_times = []
+    layout_times = array('q', [0]) * iterations
     
     for i in range(iterations):
-        simulated_windows = [
-            WindowInfo(j, f"Window {j}", f"app{j}.exe", 100+j, 
-                      (j*10, j*10, j*10+800, j*10+600), True, True)
-            for j in range(windows)
-        ]
-        
-        start_time = time.time()
-        positions = layout_engine.apply_layout("grid", simulated_windows)
-        end_time = time.time()
-        layout_times.append(end_time - start_time)
-    
-    results['results']['layout_calculation'] = {
-        'average_time': format_duration(sum(layout_times) / len(layout_times)),
-        'min_time': format_duration(min(layout_times)),
-        'max_time': format_duration(max(layout_times)),
-        'total_time': format_duration(sum(layout_times))
-    }
+        start_time = time.perf_counter_ns()
+        layout_engine.apply_layout("grid", simulated_windows)
+        layout_times[i] = time.perf_counter_ns() - start_time
+        if report_progress and (i & 63) == 63:
+            output.progress(f"布局计算 {i + 1}/{iterations}")
+    
+    results['results']['layout_calculation'] = _summarize_times(layout_times)
     
     # 内存使用测试
     output.progress("测试内存使用...")
     
-    process = psutil.Process()
-    initial_memory = process.memory_info().rss
+    # 使用 tracemalloc 统计 Python 层分配的字节数，比进程 RSS 更精确稳定
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    traced_initial = tracemalloc.get_traced_memory()[0]
     
-    # 创建大量窗口对象
-    large_window_set = [
-        WindowInfo(j, f"Window {j}", f"app{j}.exe", 100+j, 
-                  (j*10, j*10, j*10+800, j*10+600), True, True)
-        for j in range(windows * 10)  # 10倍窗口数量
-    ]
+    # 创建大量窗口对象（10倍窗口数量）
+    # WindowInfo 是 NamedTuple，没有实例 __dict__，因此这里测得的是紧凑元组的实际开销
+    window_set_size = windows * 10
+    large_window_set = _simulated_windows(window_set_size)
     
-    final_memory = process.memory_info().rss
-    memory_increase = final_memory - initial_memory
+    traced_final = tracemalloc.get_traced_memory()[0]
+    if not was_tracing:
+        tracemalloc.stop()
+    traced_increase = traced_final - traced_initial
+    del large_window_set
     
     results['results']['memory_usage'] = {
-        'initial_memory': format_bytes(initial_memory),
-        'final_memory': format_bytes(final_memory),
-        'memory_increase': format_bytes(memory_increase),
-        'memory_per_window': format_bytes(memory_increase / (windows * 10))
+        'traced_initial': format_bytes(traced_initial),
+        'traced_final': format_bytes(traced_final),
+        'traced_increase': format_bytes(traced_increase),
+        'traced_per_window': format_bytes(traced_increase / max(window_set_size, 1))
     }
     
     return results
-
-
-# 注册命令到主CLI
-def register_tool_commands(cli_group):
-    """注册工具命令到主CLI"""
-    cli_group.add_command(tool)
\ No newline at end of file
@@ -1,113 +1,166 @@
 """
 CLI Configuration Manager
 """
+import copy
+import functools
+import json
 import os
-import yaml
-from typing import Dict, Any, Optional
-from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+
+# 默认配置（只读），通过 _default_config() 获取可修改的副本
+_DEFAULTS = {
+    'default': {
+        'output_format': 'table',
+        'verbose': False,
+    },
+    'layout': {
+        'default_type': 'grid',
+        'grid_columns': 2,
+        'grid_padding': 10,
+        'cascade_offset_x': 30,
+        'cascade_offset_y': 30,
+        'stack_position': 'center',
+    },
+    'hotkeys': {
+        'enable_on_start': True,
+    },
+    'filters': {
+        'exclude_processes': ['explorer.exe', 'dwm.exe'],
+        'include_minimized': False,
+    },
+    'output': {
+        'show_colors': True,
+        'show_icons': True,
+        'table_style': 'grid',
+    }
+}
+
+
+def _default_config() -> Dict[str, Any]:
+    """返回默认配置的深拷贝"""
+    return copy.deepcopy(_DEFAULTS)
+
+
+# 默认配置文件路径，进程内首次使用时解析并创建目录
+_DEFAULT_CFG_PATH: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点号表示的配置键（结果缓存）"""
+    return tuple(key.split('.'))
 
 
 class CLIConfig:
     """CLI配置管理器"""
     
+    # PyYAML 模块及选用的 Loader/Dumper（优先 libyaml C 实现），首次读写配置时才导入
+    _yaml = None
+    _yaml_loader = None
+    _yaml_dumper = None
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
     
+    @classmethod
+    def _get_yaml(cls):
+        """按需导入 PyYAML"""
+        if cls._yaml is None:
+            import yaml
+            cls._yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            cls._yaml_dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            cls._yaml = yaml
+        return cls._yaml
+    
+    @classmethod
+    def _yaml_load(cls, stream) -> Any:
+        """解析 YAML"""
+        yaml = cls._get_yaml()
+        return yaml.load(stream, Loader=cls._yaml_loader)
+    
+    @classmethod
+    def _yaml_dump(cls, data: Any, stream):
+        """写出 YAML"""
+        yaml = cls._get_yaml()
+        yaml.dump(data, stream, Dumper=cls._yaml_dumper,
+                  default_flow_style=False, allow_unicode=True)
+    
     def _get_default_config_path(self) -> str:
         """获取默认配置文件路径"""
-        home_dir = Path.home()
-        config_dir = home_dir / '.win-manager'
-        config_dir.mkdir(exist_ok=True)
-        return str(config_dir / 'cli-config.yaml')
+        global _DEFAULT_CFG_PATH
+        if _DEFAULT_CFG_PATH is None:
+            config_dir = os.path.join(os.path.expanduser('~'), '.win-manager')
+            os.makedirs(config_dir, exist_ok=True)
+            _DEFAULT_CFG_PATH = os.path.join(config_dir, 'cli-config.yaml')
+        return _DEFAULT_CFG_PATH
     
     def _load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
-        default_config = {
-            'default': {
-                'output_format': 'table',
-                'verbose': False,
-            },
-            'layout': {
-                'default_type': 'grid',
-                'grid_columns': 2,
-                'grid_padding': 10,
-                'cascade_offset_x': 30,
-                'cascade_offset_y': 30,
-                'stack_position': 'center',
-            },
-            'hotkeys': {
-                'enable_on_start': True,
-            },
-            'filters': {
-                'exclude_processes': ['explorer.exe', 'dwm.exe'],
-                'include_minimized': False,
-            },
-            'output': {
-                'show_colors': True,
-                'show_icons': True,
-                'table_style': 'grid',
-            }
-        }
-        
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = yaml.safe_load(f) or {}
-                    # 合并默认配置和加载的配置
-                    return self._merge_configs(default_config, loaded_config)
-            except Exception as e:
-                print(f"警告: 无法加载配置文件 {self.config_path}: {e}")
-                return default_config
-        else:
-            # 创建默认配置文件
-            self._save_config(default_config)
-            return default_config
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                loaded_config = self._yaml_load(f) or {}
+            
+            # 合并默认配置和加载的配置（set() 会原地修改嵌套字典，因此基于副本合并）
+            return self._merge_configs(_default_config(), loaded_config)
+        except FileNotFoundError:
+            # 创建默认配置文件（直接写出只读的默认配置，无需复制）
+            self._save_config(_DEFAULTS)
+            return _default_config()
+        except Exception as e:
+            print(f"警告: 无法加载配置文件 {self.config_path}: {e}")
+            return _default_config()
     
     def _merge_configs(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
-        """合并配置"""
+        """合并配置（只复制被覆盖的分支）"""
+        if not loaded:
+            return default
+        
         result = default.copy()
-        for key, value in loaded.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        pending = [(result, loaded)]
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = target[key] = current.copy()
+                    pending.append((current, value))
+                else:
+                    target[key] = value
         return result
     
     def _save_config(self, config: Dict[str, Any]):
         """保存配置到文件"""
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+                self._yaml_dump(config, f)
         except Exception as e:
             print(f"警告: 无法保存配置文件: {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值（支持点号表示法）"""
-        keys = key.split('.')
         value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        try:
+            for k in _split_key(key):
                 value = value[k]
-            else:
-                return default
-        
+        except (KeyError, TypeError):
+            return default
         return value
     
     def set(self, key: str, value: Any):
         """设置配置值（支持点号表示法）"""
-        keys = key.split('.')
+        *parents, last = _split_key(key)
         config = self.config
         
         # 导航到正确的位置
-        for k in keys[:-1]:
+        for k in parents:
             if k not in config:
                 config[k] = {}
             config = config[k]
         
         # 设置值
-        config[keys[-1]] = value
+        config[last] = value
     
     def save(self):
         """保存当前配置"""
@@ -115,17 +168,18 @@ class CLIConfig:
     
     def reset(self):
         """重置配置为默认值"""
-        if os.path.exists(self.config_path):
+        try:
             os.remove(self.config_path)
+        except FileNotFoundError:
+            pass
         self.config = self._load_config()
     
     def export(self, path: str, format: str = 'yaml'):
         """导出配置"""
         if format.lower() == 'yaml':
             with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+                self._yaml_dump(self.config, f)
         elif format.lower() == 'json':
-            import json
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
         else:
@@ -136,14 +190,30 @@ class CLIConfig:
         if not os.path.exists(path):
             raise FileNotFoundError(f"配置文件不存在: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            if path.endswith('.yaml') or path.endswith('.yml'):
-                imported_config = yaml.safe_load(f)
-            elif path.endswith('.json'):
-                import json
-                imported_config = json.load(f)
-            else:
-                raise ValueError(f"不支持的配置文件格式: {path}")
+        loader = _IMPORT_LOADERS.get(os.path.splitext(path)[1].lower())
+        if loader is None:
+            raise ValueError(f"不支持的配置文件格式: {path}")
+        imported_config = loader(path)
         
         self.config = self._merge_configs(self.config, imported_config)
-        self.save()
\ No newline at end of file
+        self.save()
+
+
+def _load_yaml_file(path: str) -> Any:
+    """读取 YAML 配置文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return CLIConfig._yaml_load(f)
+
+
+def _load_json_file(path: str) -> Any:
+    """读取 JSON 配置文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# 导入配置时按扩展名选择解析函数
+_IMPORT_LOADERS = {
+    '.yaml': _load_yaml_file,
+    '.yml': _load_yaml_file,
+    '.json': _load_json_file,
+}
@@ -1,26 +1,47 @@
 """
 CLI main entry point for Win-Manager
 """
+import importlib
 import sys
 import click
 from typing import Optional, Dict
 
 from .utils.output import OutputManager
 from .utils.helpers import setup_logging
-from .config.cli_config import CLIConfig
-from .utils.validation import DIMENSION_TYPE
-
-# 导入所有命令模块
-from .commands.layout import register_layout_commands
-from .commands.window import register_window_commands
-from .commands.config import register_config_commands
-from .commands.hotkey import register_hotkey_commands
-from .commands.tool import register_tool_commands
-
-
-@click.group()
+from .utils.validation import (
+    DIMENSION_TYPE, OUTPUT_FORMAT_CHOICE, SORT_BY_CHOICE, STACK_POSITION_CHOICE
+)
+
+
+class LazyGroup(click.Group):
+    """命令组，子命令模块在首次使用时才导入"""
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, tuple]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 子命令名 -> (模块路径, 命令对象名)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name]
+            module = importlib.import_module(module_name)
+            # 加载后注册到 commands，后续调用直接命中
+            self.add_command(getattr(module, attr_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'layout': ('win_manager.cli.commands.layout', 'layout'),
+    'window': ('win_manager.cli.commands.window', 'window'),
+    'config': ('win_manager.cli.commands.config', 'config'),
+    'hotkey': ('win_manager.cli.commands.hotkey', 'hotkey'),
+    'tool': ('win_manager.cli.commands.tool', 'tool'),
+})
 @click.option('--config', type=click.Path(exists=True), help='指定配置文件路径')
-@click.option('--output', type=click.Choice(['json', 'yaml', 'table', 'text']),
+@click.option('--output', type=OUTPUT_FORMAT_CHOICE,
               default='table', help='输出格式')
 @click.option('--verbose', '-v', is_flag=True, help='详细输出')
 @click.option('--quiet', '-q', is_flag=True, help='静默模式')
@@ -39,9 +60,10 @@ def cli(ctx: click.Context, config: Optional[str], output: str, verbose: bool,
     ctx.obj['quiet'] = quiet
     ctx.obj['dry_run'] = dry_run
 
-    # 初始化配置管理器
-    cli_config = CLIConfig(config_path=config)
-    ctx.obj['cli_config'] = cli_config
+    # 配置管理器和热键管理器按需加载，见 get_cli_config / get_core_config / get_hotkey_manager
+    ctx.obj['cli_config'] = None
+    ctx.obj['core_config'] = None
+    ctx.obj['hotkey_manager'] = None
 
     # 初始化输出管理器
     output_manager = OutputManager(format=output, verbose=verbose, quiet=quiet)
@@ -50,7 +72,6 @@ def cli(ctx: click.Context, config: Optional[str], output: str, verbose: bool,
     # 设置日志
     setup_logging(verbose=verbose, quiet=quiet)
 
-
 # 快捷命令 - 直接应用布局
 @cli.command()
 @click.option('--target', multiple=True, help='目标窗口过滤')
@@ -83,7 +104,7 @@ def cascade(ctx, target: tuple, exclude: tuple, offset_x: Optional[int], offset_
 @cli.command()
 @click.option('--target', multiple=True, help='目标窗口过滤')
 @click.option('--exclude', multiple=True, help='排除窗口过滤')
-@click.option('--stack-position', type=click.Choice(['center', 'left', 'right']),
+@click.option('--stack-position', type=STACK_POSITION_CHOICE,
               help='堆叠位置')
 @click.option('--window-width', type=DIMENSION_TYPE, help='窗口宽度 (像素值如800或百分比如50%)')
 @click.option('--window-height', type=DIMENSION_TYPE, help='窗口高度 (像素值如600或百分比如75%)')
@@ -108,7 +129,7 @@ def undo(ctx):
 @cli.command()
 @click.option('--filter', 'filter_pattern', help='过滤条件')
 @click.option('--include-minimized', is_flag=True, help='包含最小化窗口')
-@click.option('--sort-by', type=click.Choice(['title', 'process', 'pid', 'size']),
+@click.option('--sort-by', type=SORT_BY_CHOICE,
               help='排序方式')
 @click.pass_context
 def ls(ctx, filter_pattern: Optional[str], include_minimized: bool, sort_by: Optional[str]):
@@ -121,14 +142,7 @@ def ls(ctx, filter_pattern: Optional[str], include_minimized: bool, sort_by: Opt
 def main():
     """主入口函数"""
     try:
-        # 注册所有命令组
-        register_layout_commands(cli)
-        register_window_commands(cli)
-        register_config_commands(cli)
-        register_hotkey_commands(cli)
-        register_tool_commands(cli)
-
-        # 启动CLI
+        # 命令组由 LazyGroup 按需加载
         cli()
     except KeyboardInterrupt:
         click.echo("\n操作被用户中断", err=True)
@@ -2,6 +2,7 @@
 Helper utilities for CLI
 """
 import logging
+import re
 import sys
 from typing import Any, Dict, List, Optional
 
@@ -44,27 +45,13 @@ def validate_window_id(window_id: str) -> bool:
     return len(window_id.strip()) > 0
 
 
+# 热键格式：一个或多个修饰符 + 非空按键，如 ctrl+alt+a
+_HOTKEY_RE = re.compile(r'(?:(?:ctrl|alt|shift|win)\+)+[^+]+', re.IGNORECASE)
+
+
 def validate_hotkey(hotkey: str) -> bool:
     """验证热键格式"""
-    # 简单验证热键格式：modifier+key
-    if '+' not in hotkey:
-        return False
-    
-    parts = hotkey.split('+')
-    if len(parts) < 2:
-        return False
-    
-    valid_modifiers = ['ctrl', 'alt', 'shift', 'win']
-    modifiers = parts[:-1]
-    key = parts[-1]
-    
-    # 检查修饰符
-    for modifier in modifiers:
-        if modifier.lower() not in valid_modifiers:
-            return False
-    
-    # 检查键
-    return len(key) > 0
+    return _HOTKEY_RE.fullmatch(hotkey) is not None
 
 
 def format_window_info(window_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -85,42 +72,70 @@ def format_window_list(windows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return [format_window_info(window) for window in windows]
 
 
+# 位置: "x,y" 或 "x,y,width,height"；大小: "width,height" 或 "widthxheight"
+# 正则只负责切分字段，数值仍交给 int() 校验（允许空白、正负号和下划线分隔）
+_POS_RE = re.compile(r'([^,]+),([^,]+)(?:,([^,]+),([^,]+))?')
+_SIZE_RE = re.compile(r'([^,x]+)[x,]([^,x]+)')
+
+
 def parse_position(position_str: str) -> tuple:
     """解析位置字符串"""
-    # 格式: "x,y" 或 "x,y,width,height"
-    try:
-        parts = position_str.split(',')
-        if len(parts) == 2:
-            return (int(parts[0]), int(parts[1]))
-        elif len(parts) == 4:
-            return (int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]))
-        else:
-            raise ValueError("位置格式错误")
-    except ValueError:
-        raise ValueError(f"无效的位置格式: {position_str}")
+    match = _POS_RE.fullmatch(position_str)
+    if match:
+        try:
+            return tuple(int(g) for g in match.groups() if g is not None)
+        except ValueError:
+            pass
+    raise ValueError(f"无效的位置格式: {position_str}")
 
 
 def parse_size(size_str: str) -> tuple:
     """解析大小字符串"""
-    # 格式: "width,height" 或 "widthxheight"
-    try:
-        if 'x' in size_str:
-            parts = size_str.split('x')
-        else:
-            parts = size_str.split(',')
-        
-        if len(parts) == 2:
-            return (int(parts[0]), int(parts[1]))
-        else:
-            raise ValueError("大小格式错误")
-    except ValueError:
-        raise ValueError(f"无效的大小格式: {size_str}")
+    match = _SIZE_RE.fullmatch(size_str)
+    if match:
+        try:
+            return (int(match.group(1)), int(match.group(2)))
+        except ValueError:
+            pass
+    raise ValueError(f"无效的大小格式: {size_str}")
+
+
+def get_cli_config(ctx):
+    """获取CLI配置管理器（每次CLI调用只加载一次）"""
+    obj = ctx.ensure_object(dict)
+    cli_config = obj.get('cli_config')
+    if cli_config is None:
+        from ..config.cli_config import CLIConfig
+        cli_config = CLIConfig(config_path=obj.get('config_path'))
+        obj['cli_config'] = cli_config
+    return cli_config
+
+
+def get_core_config(ctx):
+    """获取核心配置管理器（每次CLI调用只加载一次）"""
+    obj = ctx.ensure_object(dict)
+    core_config = obj.get('core_config')
+    if core_config is None:
+        from win_manager.core.config_manager import ConfigManager
+        core_config = ConfigManager()
+        obj['core_config'] = core_config
+    return core_config
+
+
+def get_hotkey_manager(ctx):
+    """获取热键管理器（同一次CLI调用中共享同一实例）"""
+    obj = ctx.ensure_object(dict)
+    hotkey_manager = obj.get('hotkey_manager')
+    if hotkey_manager is None:
+        from win_manager.utils.hotkey_manager import HotkeyManager
+        hotkey_manager = HotkeyManager()
+        obj['hotkey_manager'] = hotkey_manager
+    return hotkey_manager
 
 
 def get_error_message(error: Exception) -> str:
     """获取错误消息"""
-    error_type = type(error).__name__
-    return f"{error_type}: {str(error)}"
+    return f"{error.__class__.__name__}: {error}"
 
 
 def confirm_action(message: str) -> bool:
@@ -139,27 +154,26 @@ def truncate_string(text: str, max_length: int = 50) -> str:
     return text[:max_length - 3] + "..."
 
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_bytes(bytes_value: int) -> str:
     """格式化字节数"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} TB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    # 由二进制位数直接算出单位（每 10 位一级），无需逐级相除
+    index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
 
 
 def format_duration(seconds: float) -> str:
     """格式化持续时间"""
     if seconds < 1:
         return f"{seconds*1000:.1f}ms"
-    elif seconds < 60:
+    if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        seconds = seconds % 60
-        return f"{minutes}m {seconds:.1f}s"
-    else:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        seconds = seconds % 60
-        return f"{hours}h {minutes}m {seconds:.1f}s"
\ No newline at end of file
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{int(minutes)}m {seconds:.1f}s"
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours}h {minutes}m {seconds:.1f}s"
\ No newline at end of file
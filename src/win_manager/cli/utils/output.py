@@ -1,38 +1,99 @@
 """
 Output formatting utilities for CLI
 """
+import datetime
 import json
+import textwrap
 import yaml
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from rich.console import Console
-from rich.table import Table
+from rich.table import Column, Table
 from rich.panel import Panel
 from rich.text import Text
 from tabulate import tabulate
 import sys
 
+# 优先使用 libyaml 的 C 实现输出 YAML
+try:
+    from yaml import CSafeDumper as _BaseYamlDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseYamlDumper
+
+
+class _YamlDumper(_BaseYamlDumper):
+    """安全的 YAML Dumper，元组（如窗口 rect）按列表输出"""
+
+
+_YamlDumper.add_representer(tuple, _YamlDumper.represent_list)
+
+# safe dumper 可直接表示的标量类型
+_YAML_SCALAR_TYPES = (str, int, float, bool, bytes, datetime.date, type(None))
+
+
+def _yaml_data(data: Any) -> Any:
+    """递归转换为 safe dumper 可表示的数据（NamedTuple 转字典，其他容器转列表，未知对象转字符串）"""
+    if isinstance(data, _YAML_SCALAR_TYPES):
+        return data
+    if isinstance(data, dict):
+        return {key: _yaml_data(value) for key, value in data.items()}
+    if isinstance(data, tuple) and hasattr(data, '_asdict'):
+        return _yaml_data(data._asdict())
+    if isinstance(data, (list, tuple, set, frozenset)):
+        return [_yaml_data(item) for item in data]
+    return str(data)
+
+
+# 可选依赖 orjson（C 实现，直接生成 UTF-8），不可用时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """序列化为缩进 2 格的 JSON 文本"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# print_stream 文本模式每次写出的最大行数
+_STREAM_CHUNK_LINES = 64
+
 
 class OutputManager:
     """输出管理器"""
     
+    # 需要移除的零宽度字符和字节顺序标记，一次 translate 全部删除
+    _ZW_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\ufeff')
+    
     def __init__(self, format: str = 'table', verbose: bool = False, quiet: bool = False):
         self.format = format
         self.verbose = verbose
         self.quiet = quiet
         self.console = Console()
+        self._err_console: Optional[Console] = None
+    
+    @property
+    def err_console(self) -> Console:
+        """诊断信息（错误、警告、信息、进度）使用的 stderr 控制台，首次使用时创建"""
+        if self._err_console is None:
+            self._err_console = Console(stderr=True)
+        return self._err_console
+    
+    def should_emit(self, level: str = 'normal') -> bool:
+        """判断某级别的消息是否会输出（调用方可据此跳过昂贵的消息构造）"""
+        return not self.quiet and (level != 'verbose' or self.verbose)
     
     def _clean_text(self, text: str) -> str:
         """清理文本中的特殊字符以避免编码问题"""
         if not isinstance(text, str):
             return str(text)
         
-        # 移除零宽度字符和其他问题字符
-        clean_text = text.replace('\u200b', '')  # 零宽度空格
-        clean_text = clean_text.replace('\u200c', '')  # 零宽度不连字符
-        clean_text = clean_text.replace('\u200d', '')  # 零宽度连字符
-        clean_text = clean_text.replace('\ufeff', '')  # 字节顺序标记
-        
-        return clean_text
+        # 纯 ASCII 文本不可能包含这些字符，直接返回（isascii 为 O(1) 检查）
+        if text.isascii():
+            return text
+        return text.translate(self._ZW_TABLE)
     
     def _clean_data(self, data: Any) -> Any:
         """递归清理数据结构中的文本"""
@@ -42,16 +103,30 @@ class OutputManager:
             return {key: self._clean_data(value) for key, value in data.items()}
         elif isinstance(data, list):
             return [self._clean_data(item) for item in data]
+        elif isinstance(data, tuple) and hasattr(data, '_asdict'):
+            # NamedTuple 行数据在输出时转换为字典
+            return self._clean_data(data._asdict())
         else:
             return data
     
+    @staticmethod
+    def _rows_as_dicts(data: Any) -> Any:
+        """将 NamedTuple 行列表转换为字典列表（其他数据原样返回）"""
+        if isinstance(data, list) and data and hasattr(data[0], '_asdict'):
+            return [row._asdict() for row in data]
+        return data
+    
     def print(self, data: Any, message: str = "", success: bool = True):
         """打印数据"""
         if self.quiet:
             return
         
-        # 清理数据
-        data = self._clean_data(data)
+        # 只有直接显示的 table/text 格式需要逐项清理文本；
+        # json/yaml 由序列化器处理 Unicode，仅需把行元组转换为字典
+        if self.format in ('table', 'text'):
+            data = self._clean_data(data)
+        else:
+            data = self._rows_as_dicts(data)
         message = self._clean_text(message)
         
         if self.format == 'json':
@@ -59,12 +134,53 @@ class OutputManager:
         elif self.format == 'yaml':
             self._print_yaml(data, message, success)
         elif self.format == 'table':
-            self._print_table(data, message, success)
+            # 进入 Console 缓冲区，消息和表格在退出时一次性写出
+            with self.console:
+                self._print_table(data, message, success)
         elif self.format == 'text':
             self._print_text(data, message, success)
         else:
             raise ValueError(f"不支持的输出格式: {self.format}")
     
+    def print_stream(self, items: Iterable[Any], message: str = "", success: bool = True):
+        """逐项打印列表数据
+
+        text 和 json 格式边生成边输出，无需先构建完整列表；
+        table 和 yaml 格式需要完整数据，仍会先收集再输出。
+        """
+        if self.quiet:
+            return
+        
+        message = self._clean_text(message)
+        
+        if self.format == 'text':
+            # 按块合并写出：仍然边生成边输出，但不再每行一次 write
+            lines = []
+            if message:
+                icon = "√" if success else "×"
+                lines.append(f"{icon} {message}\n")
+            for i, item in enumerate(items, 1):
+                lines.append(f"{i}. {self._clean_data(item)}\n")
+                if len(lines) >= _STREAM_CHUNK_LINES:
+                    sys.stdout.write(''.join(lines))
+                    lines.clear()
+            if lines:
+                sys.stdout.write(''.join(lines))
+            sys.stdout.flush()
+        elif self.format == 'json':
+            # 输出结果与 _print_json 完全一致
+            sys.stdout.write(f'{{\n  "success": {json.dumps(success)},\n  "data": [')
+            separator = '\n'
+            for item in items:
+                if hasattr(item, '_asdict'):
+                    item = item._asdict()
+                chunk = _dumps(item)
+                sys.stdout.write(separator + textwrap.indent(chunk, '    '))
+                separator = ',\n'
+            closing = ']' if separator == '\n' else '\n  ]'
+            sys.stdout.write(f'{closing},\n  "message": {json.dumps(message, ensure_ascii=False)}\n}}\n')
+        else:
+            self.print(list(items), message, success)
     
     def _print_json(self, data: Any, message: str, success: bool):
         """JSON格式输出"""
@@ -73,16 +189,16 @@ class OutputManager:
             "data": data,
             "message": message
         }
-        print(json.dumps(output, ensure_ascii=False, indent=2))
+        print(_dumps(output))
     
     def _print_yaml(self, data: Any, message: str, success: bool):
         """YAML格式输出"""
         output = {
             "success": success,
-            "data": data,
+            "data": _yaml_data(data),
             "message": message
         }
-        print(yaml.dump(output, default_flow_style=False, allow_unicode=True))
+        print(yaml.dump(output, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True))
     
     def _print_table(self, data: Any, message: str, success: bool):
         """表格格式输出"""
@@ -102,35 +218,41 @@ class OutputManager:
     
     def _print_text(self, data: Any, message: str, success: bool):
         """文本格式输出"""
+        lines = []
         if message:
             icon = "√" if success else "×"
-            print(f"{icon} {message}")
+            lines.append(f"{icon} {message}")
         
         if isinstance(data, dict):
-            for key, value in data.items():
-                print(f"• {key}: {value}")
+            lines.extend(f"• {key}: {value}" for key, value in data.items())
         elif isinstance(data, list):
-            for i, item in enumerate(data, 1):
-                print(f"{i}. {item}")
+            lines.extend(f"{i}. {item}" for i, item in enumerate(data, 1))
         elif data is not None:
-            print(str(data))
+            lines.append(str(data))
+        
+        # 合并为一次写出，避免逐行 write
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
     
     def _print_dict_table(self, data: List[Dict]):
         """打印字典列表为表格"""
         if not data:
             return
         
-        table = Table()
-        
-        # 添加列
-        keys = data[0].keys()
-        for key in keys:
-            table.add_column(key, style="cyan")
+        # 列在构造时一次给出
+        keys = tuple(data[0])
+        table = Table(*[Column(key, style="cyan") for key in keys])
         
-        # 添加行
+        # 添加行（局部绑定 add_row，行内容一次生成）；
+        # 各行通常键相同，直接索引，仅缺键的行回退到 get
+        add_row = table.add_row
         for item in data:
-            row = [str(item.get(key, '')) for key in keys]
-            table.add_row(*row)
+            try:
+                add_row(*[str(item[key]) for key in keys])
+            except KeyError:
+                get = item.get
+                add_row(*[str(get(key, '')) for key in keys])
         
         self.console.print(table)
     
@@ -164,38 +286,38 @@ class OutputManager:
                 "error": message,
                 "data": None
             }
-            print(json.dumps(error_data, ensure_ascii=False, indent=2))
+            print(_dumps(error_data))
         elif self.format == 'yaml':
             error_data = {
                 "success": False,
                 "error": message,
                 "data": None
             }
-            print(yaml.dump(error_data, default_flow_style=False, allow_unicode=True))
+            print(yaml.dump(error_data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True))
         else:
-            self.console.print(f"× 错误: {message}", style="red")
+            self.err_console.print(f"× 错误: {message}", style="red")
     
     def warning(self, message: str):
         """输出警告信息"""
-        if not self.quiet:
+        if self.should_emit():
             if self.format in ['json', 'yaml']:
                 # 在结构化输出中，警告通常不单独输出
                 pass
             else:
-                self.console.print(f"! 警告: {message}", style="yellow")
+                self.err_console.print(f"! 警告: {message}", style="yellow")
     
     def info(self, message: str):
         """输出信息"""
-        if self.verbose and not self.quiet:
+        if self.should_emit('verbose'):
             if self.format in ['json', 'yaml']:
                 # 在结构化输出中，信息通常不单独输出
                 pass
             else:
-                self.console.print(f"i 信息: {message}", style="blue")
+                self.err_console.print(f"i 信息: {message}", style="blue")
     
     def success(self, message: str):
         """输出成功信息"""
-        if not self.quiet:
+        if self.should_emit():
             if self.format in ['json', 'yaml']:
                 # 在结构化输出中，成功消息通常包含在主要输出中
                 pass
@@ -204,8 +326,8 @@ class OutputManager:
     
     def progress(self, message: str):
         """输出进度信息"""
-        if self.verbose and not self.quiet and self.format not in ['json', 'yaml']:
-            self.console.print(f"→ {message}", style="cyan")
+        if self.should_emit('verbose') and self.format not in ['json', 'yaml']:
+            self.err_console.print(f"→ {message}", style="cyan")
     
     def print_section(self, title: str, data: Any = None):
         """打印分节信息"""
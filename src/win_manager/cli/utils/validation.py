@@ -1,10 +1,35 @@
 """
 Parameter validation utilities
 """
+import os
 import click
 from typing import Any, Dict, List, Optional, Union
 
 
+# 有效选项集合（模块加载时构建一次），以及对应的错误提示文本
+_LAYOUT_TYPES = ('cascade', 'grid', 'stack')
+_VALID_LAYOUTS = frozenset(_LAYOUT_TYPES)
+_VALID_LAYOUTS_MSG = ', '.join(_LAYOUT_TYPES)
+
+_STACK_POSITIONS = ('center', 'left', 'right')
+_VALID_POSITIONS = frozenset(_STACK_POSITIONS)
+_VALID_POSITIONS_MSG = ', '.join(_STACK_POSITIONS)
+
+_SORT_FIELDS = ('title', 'process', 'pid', 'size')
+_VALID_SORT_FIELDS = frozenset(_SORT_FIELDS)
+_VALID_SORT_FIELDS_MSG = ', '.join(_SORT_FIELDS)
+
+_COMPONENTS = ('detector', 'controller', 'layout', 'config', 'hotkey', 'all')
+_VALID_COMPONENTS = frozenset(_COMPONENTS)
+_VALID_COMPONENTS_MSG = ', '.join(_COMPONENTS)
+
+_MODIFIERS = ('ctrl', 'alt', 'shift', 'win')
+_VALID_MODIFIERS = frozenset(_MODIFIERS)
+_VALID_MODIFIERS_MSG = ', '.join(_MODIFIERS)
+
+_INPUT_PATH_PARAMS = frozenset({'config', 'import_path'})
+
+
 def validate_window_target(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
     """验证窗口目标参数"""
     if value is None:
@@ -23,9 +48,8 @@ def validate_layout_type(ctx: click.Context, param: click.Parameter, value: Any)
     if value is None:
         return value
     
-    valid_layouts = ['cascade', 'grid', 'stack']
-    if value not in valid_layouts:
-        raise click.BadParameter(f"无效的布局类型: {value}。有效选项: {', '.join(valid_layouts)}")
+    if value not in _VALID_LAYOUTS:
+        raise click.BadParameter(f"无效的布局类型: {value}。有效选项: {_VALID_LAYOUTS_MSG}")
     
     return value
 
@@ -75,14 +99,12 @@ def validate_hotkey_combination(ctx: click.Context, param: click.Parameter, valu
     if len(parts) < 2:
         raise click.BadParameter("热键组合格式错误，格式: modifier+key")
     
-    valid_modifiers = ['ctrl', 'alt', 'shift', 'win']
-    modifiers = parts[:-1]
-    key = parts[-1]
+    *modifiers, key = parts
     
-    # 检查修饰符
-    for modifier in modifiers:
-        if modifier not in valid_modifiers:
-            raise click.BadParameter(f"无效的修饰符: {modifier}。有效选项: {', '.join(valid_modifiers)}")
+    # 检查修饰符（集合差集一次找出全部无效修饰符）
+    invalid = set(modifiers) - _VALID_MODIFIERS
+    if invalid:
+        raise click.BadParameter(f"无效的修饰符: {', '.join(sorted(invalid))}。有效选项: {_VALID_MODIFIERS_MSG}")
     
     # 检查键
     if not key:
@@ -112,13 +134,12 @@ def validate_file_path(ctx: click.Context, param: click.Parameter, value: Any) -
     if value is None:
         return value
     
-    import os
     path = str(value).strip()
     if not path:
         raise click.BadParameter("文件路径不能为空")
     
     # 检查路径是否存在（对于输入文件）
-    if param.name in ['config', 'import_path'] and not os.path.exists(path):
+    if param.name in _INPUT_PATH_PARAMS and not os.path.exists(path):
         raise click.BadParameter(f"文件不存在: {path}")
     
     return path
@@ -129,9 +150,8 @@ def validate_stack_position(ctx: click.Context, param: click.Parameter, value: A
     if value is None:
         return value
     
-    valid_positions = ['center', 'left', 'right']
-    if value not in valid_positions:
-        raise click.BadParameter(f"无效的堆叠位置: {value}。有效选项: {', '.join(valid_positions)}")
+    if value not in _VALID_POSITIONS:
+        raise click.BadParameter(f"无效的堆叠位置: {value}。有效选项: {_VALID_POSITIONS_MSG}")
     
     return value
 
@@ -141,9 +161,8 @@ def validate_sort_by(ctx: click.Context, param: click.Parameter, value: Any) ->
     if value is None:
         return value
     
-    valid_fields = ['title', 'process', 'pid', 'size']
-    if value not in valid_fields:
-        raise click.BadParameter(f"无效的排序字段: {value}。有效选项: {', '.join(valid_fields)}")
+    if value not in _VALID_SORT_FIELDS:
+        raise click.BadParameter(f"无效的排序字段: {value}。有效选项: {_VALID_SORT_FIELDS_MSG}")
     
     return value
 
@@ -193,9 +212,8 @@ def validate_component_name(ctx: click.Context, param: click.Parameter, value: A
     if value is None:
         return value
     
-    valid_components = ['detector', 'controller', 'layout', 'config', 'hotkey', 'all']
-    if value not in valid_components:
-        raise click.BadParameter(f"无效的组件名称: {value}。有效选项: {', '.join(valid_components)}")
+    if value not in _VALID_COMPONENTS:
+        raise click.BadParameter(f"无效的组件名称: {value}。有效选项: {_VALID_COMPONENTS_MSG}")
     
     return value
 
@@ -282,4 +300,10 @@ class DimensionType(click.ParamType):
 # 自定义参数类型实例
 POSITION_TYPE = PositionType()
 SIZE_TYPE = SizeType()
-DIMENSION_TYPE = DimensionType()
\ No newline at end of file
+DIMENSION_TYPE = DimensionType()
+
+# 共享的选项类型实例（多个命令复用同一对象）
+OUTPUT_FORMAT_CHOICE = click.Choice(['json', 'yaml', 'table', 'text'])
+SORT_BY_CHOICE = click.Choice(list(_SORT_FIELDS))
+STACK_POSITION_CHOICE = click.Choice(list(_STACK_POSITIONS))
+CONFIG_TARGET_CHOICE = click.Choice(['cli', 'core', 'both'])
@@ -2,11 +2,7 @@
 Core module initialization.
 """
 
-from .window_detector import WindowDetector, WindowInfo
-from .window_controller import WindowController
-from .layout_manager import LayoutEngine, CascadeLayout, GridLayout, StackLayout
-from .config_manager import ConfigManager
-from .window_manager import WindowManager
+from importlib import import_module
 
 __all__ = [
     "WindowDetector",
@@ -18,4 +14,31 @@ __all__ = [
     "StackLayout",
     "ConfigManager",
     "WindowManager"
-]
\ No newline at end of file
+]
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# e.g. ``core.config_manager`` does not load the win32 bindings.
+_LAZY_IMPORTS = {
+    "WindowDetector": ".window_detector",
+    "WindowInfo": ".window_detector",
+    "WindowController": ".window_controller",
+    "LayoutEngine": ".layout_manager",
+    "CascadeLayout": ".layout_manager",
+    "GridLayout": ".layout_manager",
+    "StackLayout": ".layout_manager",
+    "ConfigManager": ".config_manager",
+    "WindowManager": ".window_manager",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
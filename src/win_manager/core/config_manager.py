@@ -4,9 +4,78 @@ Configuration management system.
 
 import os
 import json
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_DEFAULT_CONFIG = {
+    "window_management": {
+        "default_layout": "cascade",
+        "cascade_offset_x": 30,
+        "cascade_offset_y": 30,
+        "grid_columns": None,
+        "grid_padding": 10,
+        "stack_position": "center"
+    },
+    "filters": {
+        "ignore_fixed_size": True,
+        "ignore_minimized": True,
+        "ignore_system_windows": True,
+        "excluded_processes": [
+            "explorer.exe",
+            "winlogon.exe",
+            "csrss.exe",
+            "dwm.exe"
+        ]
+    },
+    "hotkeys": {
+        "organize_windows": "ctrl+alt+o",
+        "cascade_layout": "ctrl+alt+c",
+        "grid_layout": "ctrl+alt+g",
+        "stack_layout": "ctrl+alt+s",
+        "undo_layout": "ctrl+alt+u"
+    },
+    "ui": {
+        "show_system_tray": True,
+        "start_minimized": False,
+        "confirm_actions": True,
+        "show_notifications": True
+    },
+    "advanced": {
+        "save_window_states": True,
+        "restore_on_startup": False,
+        "check_updates": True,
+        "log_level": "INFO"
+    }
+}
+
+# Serialized once; json.loads of it is a cheaper fresh copy than deepcopy
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG)
+
+
+def _write_json(path, data: Dict[str, Any]) -> None:
+    """Write data as indented JSON, in a single write when orjson is available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    # json.dump issues many small writes; a larger buffer batches them
+    with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key (results are cached)."""
+    return tuple(key.split('.'))
+
 
 class ConfigManager:
     """Manages application configuration."""
@@ -20,81 +89,39 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.json"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        self.default_config = {
-            "window_management": {
-                "default_layout": "cascade",
-                "cascade_offset_x": 30,
-                "cascade_offset_y": 30,
-                "grid_columns": None,
-                "grid_padding": 10,
-                "stack_position": "center"
-            },
-            "filters": {
-                "ignore_fixed_size": True,
-                "ignore_minimized": True,
-                "ignore_system_windows": True,
-                "excluded_processes": [
-                    "explorer.exe",
-                    "winlogon.exe",
-                    "csrss.exe",
-                    "dwm.exe"
-                ]
-            },
-            "hotkeys": {
-                "organize_windows": "ctrl+alt+o",
-                "cascade_layout": "ctrl+alt+c",
-                "grid_layout": "ctrl+alt+g",
-                "stack_layout": "ctrl+alt+s",
-                "undo_layout": "ctrl+alt+u"
-            },
-            "ui": {
-                "show_system_tray": True,
-                "start_minimized": False,
-                "confirm_actions": True,
-                "show_notifications": True
-            },
-            "advanced": {
-                "save_window_states": True,
-                "restore_on_startup": False,
-                "check_updates": True,
-                "log_level": "INFO"
-            }
-        }
+        self.default_config = json.loads(_DEFAULT_CONFIG_JSON)
         
         self.config = self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        import copy
-        
         if not self.config_file.exists():
-            return copy.deepcopy(self.default_config)
+            return json.loads(_DEFAULT_CONFIG_JSON)
         
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
             # Merge with default config to ensure all keys exist
-            merged_config = self._merge_configs(self.default_config, config)
+            merged_config = self._merge_configs(json.loads(_DEFAULT_CONFIG_JSON), config)
             return merged_config
         except (json.JSONDecodeError, IOError):
-            return copy.deepcopy(self.default_config)
+            return json.loads(_DEFAULT_CONFIG_JSON)
     
     def save_config(self) -> bool:
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            _write_json(self.config_file, self.config)
             return True
         except IOError:
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split('.')
+        # Always walk the live tree: callers may change nested dicts directly,
+        # so only the key split (not the resolved value) is cached
         value = self.config
-        
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -104,33 +131,38 @@ class ConfigManager:
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation."""
-        keys = key.split('.')
+        *parents, last = _split_key(key)
         config = self.config
         
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        for k in parents:
+            config = config.setdefault(k, {})
         
-        config[keys[-1]] = value
+        config[last] = value
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values at once (keys may use dot notation)."""
+        for key, value in values.items():
+            self.set(key, value)
     
     def _merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge user config with default config."""
-        import copy
-        merged = copy.deepcopy(default)
-        
-        for key, value in user.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_configs(merged[key], value)
-            else:
-                merged[key] = value
+        """Merge user config with default config (copying only overridden branches)."""
+        merged = dict(default)
+        pending = [(merged, user)]
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = target[key] = dict(current)
+                    pending.append((current, value))
+                else:
+                    target[key] = value
         
         return merged
     
     def reset_to_default(self) -> None:
         """Reset configuration to default values."""
-        import copy
-        self.config = copy.deepcopy(self.default_config)
+        self.config = json.loads(_DEFAULT_CONFIG_JSON)
     
     def get_excluded_processes(self) -> list:
         """Get list of excluded processes."""
@@ -161,8 +193,7 @@ class ConfigManager:
     def export_config(self, file_path: str) -> bool:
         """Export configuration to file."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            _write_json(file_path, self.config)
             return True
         except IOError:
             return False
@@ -173,7 +204,7 @@ class ConfigManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
-            self.config = self._merge_configs(self.default_config, config)
+            self.config = self._merge_configs(json.loads(_DEFAULT_CONFIG_JSON), config)
             return True
         except (json.JSONDecodeError, IOError):
             return False
\ No newline at end of file
@@ -8,6 +8,112 @@ from abc import ABC, abstractmethod
 from ..core.window_detector import WindowInfo
 
 
+Positions = Dict[int, Tuple[int, int, int, int]]
+
+
+def _cascade_positions(windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int],
+                       offset_x: int = 30, offset_y: int = 30) -> Positions:
+    """Calculate cascade positions."""
+    positions = {}
+    screen_left, screen_top, screen_right, screen_bottom = screen_rect
+    
+    # Calculate window size (70% of screen)
+    window_width = int((screen_right - screen_left) * 0.7)
+    window_height = int((screen_bottom - screen_top) * 0.7)
+    
+    for i, window in enumerate(windows):
+        x = screen_left + (i * offset_x)
+        y = screen_top + (i * offset_y)
+        
+        # Ensure window doesn't go off screen
+        if x + window_width > screen_right:
+            x = screen_left
+        if y + window_height > screen_bottom:
+            y = screen_top
+        
+        positions[window.hwnd] = (x, y, window_width, window_height)
+    
+    return positions
+
+
+def _grid_positions(windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int],
+                    columns: Optional[int] = None, padding: int = 10) -> Positions:
+    """Calculate grid positions."""
+    positions = {}
+    screen_left, screen_top, screen_right, screen_bottom = screen_rect
+    
+    window_count = len(windows)
+    if window_count == 0:
+        return positions
+    
+    # Calculate grid dimensions
+    if columns is None:
+        columns = int(window_count ** 0.5) + 1
+    
+    rows = (window_count + columns - 1) // columns
+    
+    # Calculate window size
+    available_width = screen_right - screen_left - (padding * (columns + 1))
+    available_height = screen_bottom - screen_top - (padding * (rows + 1))
+    
+    window_width = available_width // columns
+    window_height = available_height // rows
+    
+    for i, window in enumerate(windows):
+        row = i // columns
+        col = i % columns
+        
+        x = screen_left + padding + col * (window_width + padding)
+        y = screen_top + padding + row * (window_height + padding)
+        
+        positions[window.hwnd] = (x, y, window_width, window_height)
+    
+    return positions
+
+
+def _resolve_dimension(dimension: Optional[Dict], screen_size: int) -> int:
+    """Resolve a pixel/percentage dimension; 80% of the screen when unset."""
+    if dimension is None:
+        return int(screen_size * 0.8)
+    if dimension['type'] == 'percentage':
+        return int(screen_size * dimension['value'] / 100)
+    return dimension['value']  # pixels
+
+
+def _stack_positions(windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int],
+                     stack_position: str = "center", window_width: Optional[Dict] = None,
+                     window_height: Optional[Dict] = None) -> Positions:
+    """Calculate stack positions."""
+    screen_left, screen_top, screen_right, screen_bottom = screen_rect
+    
+    # Calculate window size - use custom size if provided, otherwise 80% of screen
+    width = _resolve_dimension(window_width, screen_right - screen_left)
+    height = _resolve_dimension(window_height, screen_bottom - screen_top)
+    
+    # Calculate position based on stack_position
+    if stack_position == "center":
+        x = screen_left + (screen_right - screen_left - width) // 2
+        y = screen_top + (screen_bottom - screen_top - height) // 2
+    elif stack_position == "right":
+        x = screen_right - width - 50
+        y = screen_top + 50
+    else:  # "left" and unknown positions
+        x = screen_left + 50
+        y = screen_top + 50
+    
+    # All windows get the same position (stacked)
+    rect = (x, y, width, height)
+    return {window.hwnd: rect for window in windows}
+
+
+# Built-in layouts dispatched by name
+_LAYOUT_FUNCS = {
+    "cascade": _cascade_positions,
+    "grid": _grid_positions,
+    "stack": _stack_positions,
+}
+
+
 class LayoutManager(ABC):
     """Abstract base class for layout managers."""
     
@@ -26,26 +132,7 @@ class CascadeLayout(LayoutManager):
     
     def calculate_positions(self, windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int]) -> Dict[int, Tuple[int, int, int, int]]:
         """Calculate cascade positions."""
-        positions = {}
-        screen_left, screen_top, screen_right, screen_bottom = screen_rect
-        
-        # Calculate window size (70% of screen)
-        window_width = int((screen_right - screen_left) * 0.7)
-        window_height = int((screen_bottom - screen_top) * 0.7)
-        
-        for i, window in enumerate(windows):
-            x = screen_left + (i * self.offset_x)
-            y = screen_top + (i * self.offset_y)
-            
-            # Ensure window doesn't go off screen
-            if x + window_width > screen_right:
-                x = screen_left
-            if y + window_height > screen_bottom:
-                y = screen_top
-            
-            positions[window.hwnd] = (x, y, window_width, window_height)
-        
-        return positions
+        return _cascade_positions(windows, screen_rect, self.offset_x, self.offset_y)
 
 
 class GridLayout(LayoutManager):
@@ -57,38 +144,7 @@ class GridLayout(LayoutManager):
     
     def calculate_positions(self, windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int]) -> Dict[int, Tuple[int, int, int, int]]:
         """Calculate grid positions."""
-        positions = {}
-        screen_left, screen_top, screen_right, screen_bottom = screen_rect
-        
-        window_count = len(windows)
-        if window_count == 0:
-            return positions
-        
-        # Calculate grid dimensions
-        if self.columns is None:
-            columns = int(window_count ** 0.5) + 1
-        else:
-            columns = self.columns
-        
-        rows = (window_count + columns - 1) // columns
-        
-        # Calculate window size
-        available_width = screen_right - screen_left - (self.padding * (columns + 1))
-        available_height = screen_bottom - screen_top - (self.padding * (rows + 1))
-        
-        window_width = available_width // columns
-        window_height = available_height // rows
-        
-        for i, window in enumerate(windows):
-            row = i // columns
-            col = i % columns
-            
-            x = screen_left + self.padding + col * (window_width + self.padding)
-            y = screen_top + self.padding + row * (window_height + self.padding)
-            
-            positions[window.hwnd] = (x, y, window_width, window_height)
-        
-        return positions
+        return _grid_positions(windows, screen_rect, self.columns, self.padding)
 
 
 class StackLayout(LayoutManager):
@@ -101,47 +157,15 @@ class StackLayout(LayoutManager):
     
     def calculate_positions(self, windows: List[WindowInfo], screen_rect: Tuple[int, int, int, int]) -> Dict[int, Tuple[int, int, int, int]]:
         """Calculate stack positions."""
-        positions = {}
-        screen_left, screen_top, screen_right, screen_bottom = screen_rect
-        screen_width = screen_right - screen_left
-        screen_height = screen_bottom - screen_top
-        
-        # Calculate window size - use custom size if provided, otherwise 80% of screen
-        if self.window_width is not None:
-            if self.window_width['type'] == 'percentage':
-                window_width = int(screen_width * self.window_width['value'] / 100)
-            else:  # pixels
-                window_width = self.window_width['value']
-        else:
-            window_width = int(screen_width * 0.8)
-            
-        if self.window_height is not None:
-            if self.window_height['type'] == 'percentage':
-                window_height = int(screen_height * self.window_height['value'] / 100)
-            else:  # pixels
-                window_height = self.window_height['value']
-        else:
-            window_height = int(screen_height * 0.8)
-        
-        # Calculate position based on stack_position
-        if self.stack_position == "center":
-            x = screen_left + (screen_right - screen_left - window_width) // 2
-            y = screen_top + (screen_bottom - screen_top - window_height) // 2
-        elif self.stack_position == "left":
-            x = screen_left + 50
-            y = screen_top + 50
-        elif self.stack_position == "right":
-            x = screen_right - window_width - 50
-            y = screen_top + 50
-        else:
-            x = screen_left + 50
-            y = screen_top + 50
-        
-        # All windows get the same position (stacked)
-        for window in windows:
-            positions[window.hwnd] = (x, y, window_width, window_height)
-        
-        return positions
+        return _stack_positions(windows, screen_rect, self.stack_position, self.window_width, self.window_height)
+
+
+# Option names (with the defaults used when omitted) that configure each built-in layout
+_LAYOUT_OPTIONS = {
+    "stack": (("stack_position", "center"), ("window_width", None), ("window_height", None)),
+    "grid": (("columns", 3), ("padding", 10)),
+    "cascade": (("offset_x", 30), ("offset_y", 30)),
+}
 
 
 class LayoutEngine:
@@ -153,10 +177,17 @@ class LayoutEngine:
             "grid": GridLayout(),
             "stack": StackLayout()
         }
+        self._screen_rect_cache: Optional[Tuple[int, int, int, int]] = None
     
     def get_screen_rect(self) -> Tuple[int, int, int, int]:
-        """Get primary screen rectangle."""
-        return (0, 0, win32api.GetSystemMetrics(0), win32api.GetSystemMetrics(1))
+        """Get primary screen rectangle (queried once, then cached)."""
+        if self._screen_rect_cache is None:
+            self._screen_rect_cache = (0, 0, win32api.GetSystemMetrics(0), win32api.GetSystemMetrics(1))
+        return self._screen_rect_cache
+    
+    def invalidate_screen_cache(self) -> None:
+        """Forget the cached screen rectangle so the next query re-reads it."""
+        self._screen_rect_cache = None
     
     def apply_layout(self, layout_name: str, windows: List[WindowInfo], **layout_options) -> Dict[int, Tuple[int, int, int, int]]:
         """Apply layout to windows."""
@@ -165,23 +196,16 @@ class LayoutEngine:
         
         layout = self.layouts[layout_name]
         
-        # Create a new instance with custom options for certain layouts
-        if layout_name == "stack":
-            stack_position = layout_options.get("stack_position", "center")
-            window_width = layout_options.get("window_width")
-            window_height = layout_options.get("window_height")
-            layout = StackLayout(stack_position=stack_position, window_width=window_width, window_height=window_height)
-        elif layout_name == "grid" and ("columns" in layout_options or "padding" in layout_options):
-            columns = layout_options.get("columns", 3)
-            padding = layout_options.get("padding", 10)
-            layout = GridLayout(columns=columns, padding=padding)
-        elif layout_name == "cascade" and ("offset_x" in layout_options or "offset_y" in layout_options):
-            offset_x = layout_options.get("offset_x", 30)
-            offset_y = layout_options.get("offset_y", 30)
-            layout = CascadeLayout(offset_x=offset_x, offset_y=offset_y)
-        
         screen_rect = self.get_screen_rect()
         
+        # Custom options call the built-in layout function directly
+        option_spec = _LAYOUT_OPTIONS.get(layout_name)
+        if option_spec is not None and (
+            layout_name == "stack" or any(name in layout_options for name, _ in option_spec)
+        ):
+            options = {name: layout_options.get(name, default) for name, default in option_spec}
+            return _LAYOUT_FUNCS[layout_name](windows, screen_rect, **options)
+        
         return layout.calculate_positions(windows, screen_rect)
     
     def add_custom_layout(self, name: str, layout: LayoutManager):
@@ -8,11 +8,19 @@ from typing import Tuple, Optional
 from .window_detector import WindowInfo
 
 
+# showCmd values reported by GetWindowPlacement (win32con.SW_SHOWMINIMIZED / SW_SHOWMAXIMIZED)
+SHOW_MINIMIZED = 2
+SHOW_MAXIMIZED = 3
+
+
 class WindowController:
     """Handles window control and manipulation."""
     
     def __init__(self):
         self.window_states = {}  # Store original window states for undo
+        # Active DeferWindowPos batch (None when moves apply immediately)
+        self._hdwp = None
+        self._deferred_moves = []
     
     def save_window_state(self, hwnd: int) -> None:
         """Save current window state for undo functionality."""
@@ -23,7 +31,7 @@ class WindowController:
                 'rect': rect,
                 'placement': placement
             }
-        except:
+        except Exception:
             pass
     
     def restore_window_state(self, hwnd: int) -> bool:
@@ -35,7 +43,7 @@ class WindowController:
             state = self.window_states[hwnd]
             win32gui.SetWindowPlacement(hwnd, state['placement'])
             return True
-        except:
+        except Exception:
             return False
     
     def move_window(self, hwnd: int, x: int, y: int, width: int, height: int) -> bool:
@@ -48,15 +56,70 @@ class WindowController:
             if win32gui.IsIconic(hwnd):
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
             
+            if self._hdwp is not None and self._defer_move(hwnd, x, y, width, height):
+                return True
+            
             # Move and resize window
-            win32gui.SetWindowPos(
-                hwnd,
-                win32con.HWND_TOP,
+            self._set_window_pos(hwnd, x, y, width, height)
+            return True
+        except Exception:
+            return False
+    
+    def _set_window_pos(self, hwnd: int, x: int, y: int, width: int, height: int) -> None:
+        """Move and resize a single window immediately."""
+        win32gui.SetWindowPos(
+            hwnd,
+            win32con.HWND_TOP,
+            x, y, width, height,
+            win32con.SWP_SHOWWINDOW
+        )
+    
+    def _defer_move(self, hwnd: int, x: int, y: int, width: int, height: int) -> bool:
+        """Queue a move in the active batch; on failure apply queued moves directly."""
+        try:
+            self._hdwp = win32gui.DeferWindowPos(
+                self._hdwp, hwnd, win32con.HWND_TOP,
                 x, y, width, height,
                 win32con.SWP_SHOWWINDOW
             )
+            self._deferred_moves.append((hwnd, x, y, width, height))
+            return True
+        except Exception:
+            # The system abandons the whole batch, so replay what was queued
+            self._hdwp = None
+            self._flush_deferred_moves()
+            return False
+    
+    def _flush_deferred_moves(self) -> None:
+        """Apply queued moves one by one (used when a batch cannot be committed)."""
+        moves, self._deferred_moves = self._deferred_moves, []
+        for move in moves:
+            try:
+                self._set_window_pos(*move)
+            except Exception:
+                pass
+    
+    def begin_deferred_moves(self, count: int) -> None:
+        """Collect subsequent move_window calls into one DeferWindowPos batch."""
+        self._deferred_moves = []
+        try:
+            self._hdwp = win32gui.BeginDeferWindowPos(count)
+        except Exception:
+            self._hdwp = None
+    
+    def end_deferred_moves(self) -> bool:
+        """Apply all moves collected since begin_deferred_moves in a single pass."""
+        hdwp, self._hdwp = self._hdwp, None
+        if hdwp is None:
+            self._deferred_moves = []
+            return False
+        
+        try:
+            win32gui.EndDeferWindowPos(hdwp)
+            self._deferred_moves = []
             return True
-        except:
+        except Exception:
+            self._flush_deferred_moves()
             return False
     
     def bring_to_front(self, hwnd: int) -> bool:
@@ -64,7 +127,7 @@ class WindowController:
         try:
             win32gui.SetForegroundWindow(hwnd)
             return True
-        except:
+        except Exception:
             return False
     
     def minimize_window(self, hwnd: int) -> bool:
@@ -72,7 +135,7 @@ class WindowController:
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
             return True
-        except:
+        except Exception:
             return False
     
     def maximize_window(self, hwnd: int) -> bool:
@@ -80,7 +143,7 @@ class WindowController:
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
             return True
-        except:
+        except Exception:
             return False
     
     def restore_window(self, hwnd: int) -> bool:
@@ -88,28 +151,30 @@ class WindowController:
         try:
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
             return True
-        except:
+        except Exception:
             return False
     
     def get_window_rect(self, hwnd: int) -> Optional[Tuple[int, int, int, int]]:
         """Get window rectangle."""
         try:
             return win32gui.GetWindowRect(hwnd)
-        except:
+        except Exception:
             return None
     
     def is_window_minimized(self, hwnd: int) -> bool:
         """Check if window is minimized."""
         try:
             return win32gui.IsIconic(hwnd)
-        except:
+        except Exception:
             return False
     
     def is_window_maximized(self, hwnd: int) -> bool:
         """Check if window is maximized."""
+        return self.get_window_show_state(hwnd) == SHOW_MAXIMIZED
+    
+    def get_window_show_state(self, hwnd: int) -> Optional[int]:
+        """Get the window's showCmd (minimized, maximized or normal) in one call."""
         try:
-            placement = win32gui.GetWindowPlacement(hwnd)
-            # SW_MAXIMIZE = 3
-            return placement[1] == 3
-        except:
-            return False
\ No newline at end of file
+            return win32gui.GetWindowPlacement(hwnd)[1]
+        except Exception:
+            return None
\ No newline at end of file
@@ -2,11 +2,20 @@
 Core module for window detection and enumeration.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 import win32gui
 import win32con
 import win32process
 import psutil
-from typing import List, Dict, NamedTuple, Optional
+from typing import AbstractSet, List, Dict, NamedTuple, Optional, Tuple
+
+# How long a window's resizable flag is trusted before GetWindowLong is re-read
+_STYLE_CACHE_TTL = 0.5
+
+# Visible windows needed before per-window lookups are spread over threads
+_PARALLEL_BUILD_MIN_WINDOWS = 32
+_MAX_BUILD_WORKERS = 8
 
 
 class WindowInfo(NamedTuple):
@@ -18,6 +27,8 @@ class WindowInfo(NamedTuple):
     rect: tuple  # (left, top, right, bottom)
     is_visible: bool
     is_resizable: bool
+    class_name: str = 'N/A'
+    style: str = 'N/A'
 
 
 class WindowDetector:
@@ -25,61 +36,175 @@ class WindowDetector:
     
     def __init__(self):
         self.windows: List[WindowInfo] = []
+        # pid -> process name (None when inaccessible), valid for one enumeration
+        self._pid_names: Dict[int, Optional[str]] = {}
+        # hwnd -> (timestamp, resizable), shared by back-to-back enumerations
+        self._style_cache: Dict[int, Tuple[float, bool]] = {}
+        # Lowercased title filter and excluded process names for the enumeration in progress
+        self._title_filter: Optional[str] = None
+        self._excluded: AbstractSet[str] = frozenset()
+        # Lowercased titles parallel to self.windows, rebuilt when the list changes
+        self._lower_titles: List[str] = []
+        self._indexed_windows: Optional[List[WindowInfo]] = None
     
-    def enumerate_windows(self) -> List[WindowInfo]:
-        """Enumerate all visible windows."""
+    def enumerate_windows(self, title_substr: Optional[str] = None,
+                          excluded_processes: AbstractSet[str] = frozenset()) -> List[WindowInfo]:
+        """Enumerate visible windows, optionally filtered by title and lowercased excluded process names."""
         self.windows = []
-        win32gui.EnumWindows(self._enum_windows_callback, None)
+        self._title_filter = title_substr.lower() if title_substr else None
+        self._excluded = excluded_processes
+        # One sweep over all processes instead of a psutil.Process per window;
+        # a title search only looks up the few matching pids individually
+        self._pid_names = self._snapshot_process_names() if self._title_filter is None else {}
+        self._prune_style_cache()
+        try:
+            # Collect handles first so the per-window lookups run outside EnumWindows
+            hwnds: List[int] = []
+            win32gui.EnumWindows(self._collect_visible_hwnd, hwnds)
+            if len(hwnds) >= _PARALLEL_BUILD_MIN_WINDOWS:
+                self._build_windows_parallel(hwnds)
+            else:
+                for hwnd in hwnds:
+                    self._enum_windows_callback(hwnd, None)
+        finally:
+            # PIDs may be reused once processes exit, so never keep names around
+            self._pid_names = {}
+            self._title_filter = None
+            self._excluded = frozenset()
         return self.windows
     
+    @staticmethod
+    def _collect_visible_hwnd(hwnd: int, hwnds: List[int]) -> bool:
+        """EnumWindows callback that only records visible window handles."""
+        if win32gui.IsWindowVisible(hwnd):
+            hwnds.append(hwnd)
+        return True
+    
+    def _build_windows_parallel(self, hwnds: List[int]) -> None:
+        """Build window information on a thread pool, keeping enumeration order."""
+        title_filter, excluded = self._title_filter, self._excluded
+        # Win32 and psutil lookups release the GIL, so threads overlap the calls
+        with ThreadPoolExecutor(max_workers=_MAX_BUILD_WORKERS) as executor:
+            infos = executor.map(
+                lambda hwnd: self._build_window_info(hwnd, title_filter, excluded,
+                                                     from_enumeration=True),
+                hwnds
+            )
+            self.windows.extend(info for info in infos if info is not None)
+    
     def _enum_windows_callback(self, hwnd: int, param) -> bool:
-        """Callback for window enumeration."""
-        if not win32gui.IsWindowVisible(hwnd):
-            return True
+        """Record window information for one handle collected by enumerate_windows."""
+        window_info = self._build_window_info(hwnd, self._title_filter, self._excluded,
+                                              from_enumeration=True)
+        if window_info is not None:
+            self.windows.append(window_info)
+        return True
+    
+    def _build_window_info(self, hwnd: int, title_filter: Optional[str] = None,
+                           excluded: AbstractSet[str] = frozenset(),
+                           from_enumeration: bool = False) -> Optional[WindowInfo]:
+        """Build window information for a visible, titled window."""
+        # Handles from enumerate_windows were already checked for visibility
+        if not from_enumeration and not win32gui.IsWindowVisible(hwnd):
+            return None
             
         title = win32gui.GetWindowText(hwnd)
         if not title:
-            return True
+            return None
+        # Skip the process, rect and style lookups for non-matching titles
+        if title_filter is not None and title_filter not in title.lower():
+            return None
             
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        # Single-window lookups bypass the per-enumeration pid cache
+        process_name = (self._get_process_name(pid) if from_enumeration
+                        else self._lookup_process_name(pid))
+        if process_name is None:
+            return None
+        # Excluded processes never need their rect or style fetched
+        if excluded and process_name.lower() in excluded:
+            return None
+        
+        rect = win32gui.GetWindowRect(hwnd)
+        is_resizable = self._is_window_resizable(hwnd)
+        
+        return WindowInfo(
+            hwnd=hwnd,
+            title=title,
+            process_name=process_name,
+            pid=pid,
+            rect=rect,
+            is_visible=True,
+            is_resizable=is_resizable
+        )
+    
+    @staticmethod
+    def _snapshot_process_names() -> Dict[int, Optional[str]]:
+        """Map every running pid to its process name (None when inaccessible)."""
+        return {p.pid: p.info['name'] for p in psutil.process_iter(['name'])}
+    
+    def _get_process_name(self, pid: int) -> Optional[str]:
+        """Get process name for pid, falling back to psutil for pids not yet known."""
         try:
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-            process_name = process.name()
-            
-            rect = win32gui.GetWindowRect(hwnd)
-            is_resizable = self._is_window_resizable(hwnd)
-            
-            window_info = WindowInfo(
-                hwnd=hwnd,
-                title=title,
-                process_name=process_name,
-                pid=pid,
-                rect=rect,
-                is_visible=True,
-                is_resizable=is_resizable
-            )
-            
-            self.windows.append(window_info)
-            
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return self._pid_names[pid]
+        except KeyError:
             pass
-            
-        return True
+        
+        name = self._lookup_process_name(pid)
+        self._pid_names[pid] = name
+        return name
+    
+    @staticmethod
+    def _lookup_process_name(pid: int) -> Optional[str]:
+        """Query psutil for a pid's process name (None when inaccessible)."""
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
     
     def _is_window_resizable(self, hwnd: int) -> bool:
-        """Check if window is resizable."""
+        """Check if window is resizable, reusing a recent style lookup."""
+        now = time.monotonic()
+        cached = self._style_cache.get(hwnd)
+        if cached is not None and now - cached[0] < _STYLE_CACHE_TTL:
+            return cached[1]
+        
         try:
             style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-            return bool(style & win32con.WS_THICKFRAME)
-        except:
+        except Exception:
             return False
+        
+        resizable = bool(style & win32con.WS_THICKFRAME)
+        self._style_cache[hwnd] = (now, resizable)
+        return resizable
+    
+    def _prune_style_cache(self) -> None:
+        """Drop expired style entries so closed windows do not accumulate."""
+        cutoff = time.monotonic() - _STYLE_CACHE_TTL
+        self._style_cache = {
+            hwnd: entry for hwnd, entry in self._style_cache.items()
+            if entry[0] > cutoff
+        }
     
     def get_window_by_title(self, title: str) -> Optional[WindowInfo]:
         """Get window by title."""
-        for window in self.windows:
-            if title.lower() in window.title.lower():
-                return window
-        return None
+        needle = title.lower()
+        pairs = zip(self.windows, self._get_lower_titles())
+        return next((w for w, lowered in pairs if needle in lowered), None)
+    
+    def _get_lower_titles(self) -> List[str]:
+        """Lowercased window titles, computed once per enumeration rather than per lookup."""
+        windows = self.windows
+        if self._indexed_windows is not windows or len(self._lower_titles) != len(windows):
+            self._lower_titles = [w.title.lower() for w in windows]
+            self._indexed_windows = windows
+        return self._lower_titles
+    
+    def get_window_by_hwnd(self, hwnd: int) -> Optional[WindowInfo]:
+        """Get window by handle without enumerating all windows."""
+        if not win32gui.IsWindow(hwnd):
+            return None
+        return self._build_window_info(hwnd)
     
     def get_resizable_windows(self) -> List[WindowInfo]:
         """Get only resizable windows."""
@@ -3,13 +3,22 @@ Main window manager that coordinates all components.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from .window_detector import WindowDetector, WindowInfo
-from .window_controller import WindowController
+from .window_controller import WindowController, SHOW_MINIMIZED, SHOW_MAXIMIZED
 from .layout_manager import LayoutEngine
 from .config_manager import ConfigManager
 
 
+# Window state probes are only spread over threads for larger window lists
+_PARALLEL_PROBE_MIN_WINDOWS = 32
+_MAX_PROBE_WORKERS = 32
+
+# Leading WindowInfo fields reported by get_window_list, in declaration order
+_WINDOW_LIST_FIELDS = WindowInfo._fields[:WindowInfo._fields.index('is_resizable') + 1]
+
+
 class WindowManager:
     """Main window manager class."""
     
@@ -26,29 +35,31 @@ class WindowManager:
     
     def get_manageable_windows(self) -> List[WindowInfo]:
         """Get list of windows that can be managed."""
-        all_windows = self.detector.enumerate_windows()
-        manageable_windows = []
-        
         ignore_fixed_size = self.config.get("filters.ignore_fixed_size", True)
         ignore_minimized = self.config.get("filters.ignore_minimized", True)
-        excluded_processes = self.config.get_excluded_processes()
+        # Lower-cased once into a set for O(1) lookups per window
+        excluded_processes = {p.lower() for p in self.config.get_excluded_processes()}
+        
+        # The detector skips excluded processes before fetching rect and style
+        all_windows = self.detector.enumerate_windows(excluded_processes=excluded_processes)
+        manageable_windows = []
         
         for window in all_windows:
             # Skip excluded processes
-            if window.process_name.lower() in [p.lower() for p in excluded_processes]:
+            if window.process_name.lower() in excluded_processes:
                 continue
             
             # Skip fixed size windows if configured
             if ignore_fixed_size and not window.is_resizable:
                 continue
             
-            # Skip minimized windows if configured
-            if ignore_minimized and self.controller.is_window_minimized(window.hwnd):
+            # Skip windows that are too small (likely UI elements)
+            rect = window.rect  # (left, top, right, bottom)
+            if rect[2] - rect[0] < 100 or rect[3] - rect[1] < 100:
                 continue
             
-            # Skip windows that are too small (likely UI elements)
-            left, top, right, bottom = window.rect
-            if (right - left) < 100 or (bottom - top) < 100:
+            # Skip minimized windows if configured (the only Win32 call, so checked last)
+            if ignore_minimized and self.controller.is_window_minimized(window.hwnd):
                 continue
             
             manageable_windows.append(window)
@@ -68,16 +79,23 @@ class WindowManager:
                 self.logger.info("No manageable windows found")
                 return False
             
+            # Re-read the screen size once per organize call so display changes are picked up
+            self.layout_engine.invalidate_screen_cache()
+            
             # Calculate positions
             positions = self.layout_engine.apply_layout(layout_name, windows, **layout_options)
             
-            # Apply positions
+            # Apply positions in one deferred batch (a single reposition/redraw pass)
             success_count = 0
-            for hwnd, (x, y, width, height) in positions.items():
-                if self.controller.move_window(hwnd, x, y, width, height):
-                    success_count += 1
-                else:
-                    self.logger.warning(f"Failed to move window {hwnd}")
+            self.controller.begin_deferred_moves(len(positions))
+            try:
+                for hwnd, (x, y, width, height) in positions.items():
+                    if self.controller.move_window(hwnd, x, y, width, height):
+                        success_count += 1
+                    else:
+                        self.logger.warning(f"Failed to move window {hwnd}")
+            finally:
+                self.controller.end_deferred_moves()
             
             self.logger.info(f"Successfully organized {success_count}/{len(windows)} windows using {layout_name} layout")
             return success_count > 0
@@ -101,11 +119,11 @@ class WindowManager:
     def undo_layout(self) -> bool:
         """Undo last layout change."""
         try:
-            windows = self.detector.enumerate_windows()
             success_count = 0
             
-            for window in windows:
-                if self.controller.restore_window_state(window.hwnd):
+            # Only windows with a saved state can be restored, so no enumeration is needed
+            for hwnd in list(self.controller.window_states):
+                if self.controller.restore_window_state(hwnd):
                     success_count += 1
             
             self.logger.info(f"Restored {success_count} windows to previous state")
@@ -118,23 +136,35 @@ class WindowManager:
     def get_window_list(self) -> List[Dict[str, any]]:
         """Get list of all windows with their information."""
         windows = self.detector.enumerate_windows()
-        window_list = []
+        hwnds = [window.hwnd for window in windows]
+        if len(hwnds) >= _PARALLEL_PROBE_MIN_WINDOWS:
+            # Win32 state queries release the GIL, so threads overlap the calls
+            with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(hwnds))) as executor:
+                states = list(executor.map(self._probe_window_state, hwnds))
+        else:
+            states = list(map(self._probe_window_state, hwnds))
         
-        for window in windows:
-            window_dict = {
-                "hwnd": window.hwnd,
-                "title": window.title,
-                "process_name": window.process_name,
-                "pid": window.pid,
-                "rect": window.rect,
-                "is_visible": window.is_visible,
-                "is_resizable": window.is_resizable,
-                "is_minimized": self.controller.is_window_minimized(window.hwnd),
-                "is_maximized": self.controller.is_window_maximized(window.hwnd)
-            }
-            window_list.append(window_dict)
-        
-        return window_list
+        # WindowInfo is a tuple, so zip pairs field names with values directly
+        # (stopping before class_name/style) instead of reading each attribute
+        return [
+            dict(zip(_WINDOW_LIST_FIELDS, window),
+                 is_minimized=is_minimized, is_maximized=is_maximized)
+            for window, (is_minimized, is_maximized) in zip(windows, states)
+        ]
+    
+    def _probe_window_state(self, hwnd: int) -> Tuple[bool, bool]:
+        """Get (is_minimized, is_maximized) for a window from a single placement query."""
+        show_state = self.controller.get_window_show_state(hwnd)
+        return show_state == SHOW_MINIMIZED, show_state == SHOW_MAXIMIZED
+    
+    def get_window_by_hwnd(self, hwnd: int) -> Optional[WindowInfo]:
+        """Get a single window by handle."""
+        return self.detector.get_window_by_hwnd(hwnd)
+    
+    def get_window_by_title(self, title: str) -> Optional[WindowInfo]:
+        """Get the first window whose title contains the given text."""
+        self.detector.enumerate_windows(title_substr=title)
+        return self.detector.get_window_by_title(title)
     
     def focus_window(self, hwnd: int) -> bool:
         """Bring window to front."""
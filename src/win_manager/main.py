@@ -4,7 +4,6 @@ Main entry point for Win-Manager.
 
 import sys
 import argparse
-from .core.window_manager import WindowManager
 
 
 def main():
@@ -18,6 +17,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported only once arguments are parsed, so --help skips the Win32/psutil imports
+    from .core.window_manager import WindowManager
+    
     # Initialize window manager
     wm = WindowManager()
     
@@ -5,6 +5,7 @@ Exception handling utilities for Win-Manager.
 import logging
 import traceback
 import sys
+import time
 from typing import Optional, Callable, Any
 from functools import wraps
 
@@ -54,7 +55,8 @@ class ExceptionHandler:
         """Handle an exception with logging and callbacks."""
         error_msg = f"Exception in {context}: {str(exception)}"
         self.logger.error(error_msg)
-        self.logger.debug(traceback.format_exc())
+        # exc_info defers traceback formatting until a DEBUG record is emitted
+        self.logger.debug("Traceback", exc_info=exception)
         
         # Call error callbacks
         for callback in self.error_callbacks:
@@ -115,7 +117,6 @@ def retry_on_exception(max_attempts: int = 3, delay: float = 1.0, exceptions: tu
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
             last_exception = None
             
             for attempt in range(max_attempts):
@@ -143,7 +144,7 @@ def log_exceptions(logger: Optional[logging.Logger] = None):
             except Exception as e:
                 if logger:
                     logger.error(f"Exception in {func.__name__}: {e}")
-                    logger.debug(traceback.format_exc())
+                    logger.debug("Traceback", exc_info=True)
                 raise
         return wrapper
     return decorator
@@ -2,11 +2,38 @@
 Global hotkey management for Win-Manager.
 """
 
-import threading
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Callable, Optional
-from pynput import keyboard
-from pynput.keyboard import Key, KeyCode, Listener
+
+
+# pynput is imported on first use: loading it sets up platform keyboard hooks
+# that most callers (registering, parsing, listing hotkeys) never need.
+_KEYBOARD_NAMES = ('GlobalHotKeys', 'HotKey')
+
+# Normalized modifier names -> pynput hotkey tokens
+_PYNPUT_MODIFIERS = {'ctrl': '<ctrl>', 'alt': '<alt>', 'shift': '<shift>', 'win': '<cmd>'}
+
+# Upper bound on hotkey callbacks running at once
+_CALLBACK_WORKERS = 4
+
+
+def _load_keyboard() -> None:
+    """Bind pynput's GlobalHotKeys and HotKey into this module if not yet bound."""
+    module_globals = globals()
+    if all(name in module_globals for name in _KEYBOARD_NAMES):
+        return
+    from pynput import keyboard
+    for name in _KEYBOARD_NAMES:
+        module_globals.setdefault(name, getattr(keyboard, name))
+
+
+def __getattr__(name: str):
+    if name in _KEYBOARD_NAMES:
+        _load_keyboard()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class HotkeyManager:
@@ -14,8 +41,9 @@ class HotkeyManager:
     
     def __init__(self):
         self.hotkeys: Dict[str, Callable] = {}
-        self.listener: Optional[Listener] = None
-        self.pressed_keys = set()
+        self.listener: Optional["GlobalHotKeys"] = None
+        # Runs callbacks off pynput's listener thread; created by start()
+        self._pool: Optional[ThreadPoolExecutor] = None
         self.logger = logging.getLogger(__name__)
         self.running = False
     
@@ -26,6 +54,7 @@ class HotkeyManager:
             parsed_hotkey = self._parse_hotkey(hotkey)
             if parsed_hotkey:
                 self.hotkeys[parsed_hotkey] = callback
+                self._reload_listener()
                 self.logger.info(f"Registered hotkey: {hotkey}")
                 return True
             return False
@@ -39,6 +68,7 @@ class HotkeyManager:
             parsed_hotkey = self._parse_hotkey(hotkey)
             if parsed_hotkey and parsed_hotkey in self.hotkeys:
                 del self.hotkeys[parsed_hotkey]
+                self._reload_listener()
                 self.logger.info(f"Unregistered hotkey: {hotkey}")
                 return True
             return False
@@ -52,10 +82,7 @@ class HotkeyManager:
             return True
         
         try:
-            self.listener = Listener(
-                on_press=self._on_press,
-                on_release=self._on_release
-            )
+            self.listener = self._create_listener()
             self.listener.start()
             self.running = True
             self.logger.info("Hotkey manager started")
@@ -73,8 +100,10 @@ class HotkeyManager:
             if self.listener:
                 self.listener.stop()
                 self.listener = None
+            if self._pool:
+                self._pool.shutdown(wait=False)
+                self._pool = None
             self.running = False
-            self.pressed_keys.clear()
             self.logger.info("Hotkey manager stopped")
             return True
         except Exception as e:
@@ -107,61 +136,53 @@ class HotkeyManager:
         except Exception:
             return None
     
-    def _on_press(self, key):
-        """Handle key press events."""
-        try:
-            # Convert key to string
-            key_str = self._key_to_string(key)
-            if key_str:
-                self.pressed_keys.add(key_str)
-                
-                # Check if current combination matches any registered hotkey
-                current_combo = '+'.join(sorted(self.pressed_keys))
-                if current_combo in self.hotkeys:
-                    # Execute callback in separate thread to avoid blocking
-                    threading.Thread(
-                        target=self.hotkeys[current_combo],
-                        daemon=True
-                    ).start()
-                    
-        except Exception as e:
-            self.logger.error(f"Error in key press handler: {e}")
+    def _create_listener(self) -> "GlobalHotKeys":
+        """Build a pynput GlobalHotKeys listener for the registered hotkeys."""
+        _load_keyboard()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_CALLBACK_WORKERS, thread_name_prefix='hotkey'
+            )
+        bindings = {}
+        for parsed_hotkey, callback in self.hotkeys.items():
+            combo = self._to_pynput_hotkey(parsed_hotkey)
+            try:
+                HotKey.parse(combo)
+            except ValueError:
+                self.logger.warning(f"Skipping unsupported hotkey: {parsed_hotkey}")
+                continue
+            bindings[combo] = functools.partial(self._pool.submit, self._run_callback, callback)
+        return GlobalHotKeys(bindings)
     
-    def _on_release(self, key):
-        """Handle key release events."""
+    def _run_callback(self, callback: Callable) -> None:
+        """Run a hotkey callback, logging errors the pool would otherwise swallow."""
         try:
-            key_str = self._key_to_string(key)
-            if key_str and key_str in self.pressed_keys:
-                self.pressed_keys.remove(key_str)
+            callback()
         except Exception as e:
-            self.logger.error(f"Error in key release handler: {e}")
+            self.logger.error(f"Error in hotkey callback: {e}")
     
-    def _key_to_string(self, key) -> Optional[str]:
-        """Convert key object to string representation."""
-        try:
-            if isinstance(key, KeyCode):
-                if key.char:
-                    return key.char.lower()
-                else:
-                    return f"key_{key.vk}"
-            elif isinstance(key, Key):
-                key_name = key.name.lower()
-                # Map special keys
-                key_mapping = {
-                    'ctrl_l': 'ctrl',
-                    'ctrl_r': 'ctrl',
-                    'alt_l': 'alt',
-                    'alt_r': 'alt',
-                    'shift_l': 'shift',
-                    'shift_r': 'shift',
-                    'cmd': 'win',
-                    'cmd_l': 'win',
-                    'cmd_r': 'win'
-                }
-                return key_mapping.get(key_name, key_name)
-            return None
-        except Exception:
-            return None
+    def _reload_listener(self) -> None:
+        """Restart a running listener so hotkey changes take effect."""
+        if not self.running or self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = self._create_listener()
+        self.listener.start()
+    
+    @staticmethod
+    def _to_pynput_hotkey(parsed_hotkey: str) -> str:
+        """Convert a parsed hotkey (e.g. "a+alt+ctrl") to pynput's "<alt>+<ctrl>+a" form."""
+        tokens = []
+        for part in parsed_hotkey.split('+'):
+            if part in _PYNPUT_MODIFIERS:
+                tokens.append(_PYNPUT_MODIFIERS[part])
+            elif len(part) == 1:
+                tokens.append(part)
+            elif part.startswith('key_') and part[4:].isdigit():
+                tokens.append(f"<{part[4:]}>")  # virtual key code
+            else:
+                tokens.append(f"<{part}>")
+        return '+'.join(tokens)
     
     def get_registered_hotkeys(self) -> list:
         """Get list of registered hotkeys."""
@@ -2,14 +2,24 @@
 """
 Basic CLI functionality test
 """
+import shlex
 import subprocess
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-def test_cli_command(cmd, expected_exit=0):
-    """Test a CLI command"""
+def run_cli_command(cmd):
+    """Run a CLI command without a shell, returning the result or the exception raised"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        return subprocess.run(shlex.split(cmd), shell=False, capture_output=True, text=True)
+    except Exception as e:
+        return e
+
+def test_cli_command(cmd, result, expected_exit=0):
+    """Report the result of a CLI command"""
+    try:
+        if isinstance(result, Exception):
+            raise result
         print(f"Command: {cmd}")
         print(f"Exit code: {result.returncode}")
         print(f"Output: {result.stdout[:200]}...")
@@ -44,8 +54,12 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test in tests:
-        if test_cli_command(test):
+    # Commands are independent: run them concurrently, report in order
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        results = list(executor.map(run_cli_command, tests))
+    
+    for test, result in zip(tests, results):
+        if test_cli_command(test, result):
             passed += 1
     
     print(f"\n=== Results ===")
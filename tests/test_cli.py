@@ -112,6 +112,22 @@ class TestLayoutCommands:
         assert 'columns' in result.output.lower()
         assert 'padding' in result.output.lower()
     
+    def test_layout_apply_dry_run_lists_all_options(self):
+        """测试模拟运行结果包含全部布局选项"""
+        result = self.runner.invoke(cli, ['--output', 'json', '--dry-run', 'layout', 'apply',
+                                         'grid', '--columns', '3'])
+        assert result.exit_code == 0
+        options = json.loads(result.output)['data']['options']
+        assert options == {
+            'columns': 3,
+            'padding': None,
+            'offset_x': None,
+            'offset_y': None,
+            'stack_position': None,
+            'window_width': None,
+            'window_height': None
+        }
+
     def test_layout_apply_with_filters(self):
         """测试带过滤器的布局应用"""
         result = self.runner.invoke(cli, ['--dry-run', 'layout', 'apply', 'cascade',
@@ -231,6 +247,26 @@ class TestConfigCommands:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
 
+    
+    @pytest.mark.parametrize('value,expected', [
+        ('TrUe', True),
+        ('false', False),
+        ('42', 42),
+        (' 5', 5),
+        ('1_000', 1000),
+        ('-2.5', -2.5),
+        ('inf', float('inf')),
+        ('a, b', ['a', 'b']),
+        ('1,2', ['1', '2']),
+        ('text', 'text'),
+    ])
+    def test_parse_config_value(self, value, expected):
+        """测试配置值解析"""
+        from win_manager.cli.commands.config import _parse_config_value
+        
+        result = _parse_config_value(value)
+        assert result == expected
+        assert type(result) is type(expected)
 
 class TestHotkeyCommands:
     """热键命令测试"""
@@ -324,5 +360,119 @@ class TestErrorHandling:
         assert 'required' in result.output.lower() or 'missing' in result.output.lower()
 
 
+class TestOutputManager:
+    """输出管理器测试"""
+    
+    @pytest.mark.parametrize('output_format', ['json', 'text'])
+    @pytest.mark.parametrize('data', [[], [{'name': 'grid', 'description': '网格'}, {'name': 'stack'}]])
+    def test_print_stream_matches_print(self, capsys, output_format, data):
+        """测试流式输出与一次性输出结果一致"""
+        from win_manager.cli.utils.output import OutputManager
+        
+        output = OutputManager(format=output_format)
+        output.print(data, "找到布局")
+        expected = capsys.readouterr().out
+        
+        output.print_stream(iter(data), "找到布局")
+        assert capsys.readouterr().out == expected
+        
+        if output_format == 'json':
+            assert json.loads(expected)['data'] == data
+    
+    def test_print_window_rows_as_dicts(self, capsys):
+        """测试窗口行元组按字典输出"""
+        from win_manager.cli.commands.window import WindowRow
+        from win_manager.cli.utils.output import OutputManager
+        
+        row = WindowRow(1, "Notepad", "notepad.exe", 100, "(0, 0)", "800x600", True, True)
+        OutputManager(format='json').print([row], "找到 1 个窗口")
+        
+        assert json.loads(capsys.readouterr().out)['data'] == [row._asdict()]
+    
+    def test_print_yaml_nested_data(self, capsys):
+        """测试 YAML 输出嵌套的 NamedTuple 和其他对象"""
+        from pathlib import Path
+        from win_manager.cli.utils.output import OutputManager
+        from win_manager.core.window_detector import WindowInfo
+        
+        row = WindowInfo(1, "Notepad", "notepad.exe", 100, (0, 0, 100, 100), True, True)
+        data = {'window': row, 'path': Path('config.json'), 'windows': [row]}
+        
+        OutputManager(format='yaml').print(data, "窗口信息")
+        
+        result = yaml.safe_load(capsys.readouterr().out)['data']
+        assert result['window'] == {**row._asdict(), 'rect': [0, 0, 100, 100]}
+        assert result['windows'] == [result['window']]
+        assert result['path'] == str(Path('config.json'))
+    
+    @pytest.mark.parametrize('verbose,quiet,normal,detail', [
+        (False, False, True, False),
+        (True, False, True, True),
+        (True, True, False, False),
+    ])
+    def test_should_emit(self, verbose, quiet, normal, detail):
+        """测试按输出级别判断是否输出"""
+        from win_manager.cli.utils.output import OutputManager
+        
+        output = OutputManager(verbose=verbose, quiet=quiet)
+        assert output.should_emit() is normal
+        assert output.should_emit('verbose') is detail
+
+    @pytest.mark.parametrize('text,expected', [
+        ('100,200', (100, 200)),
+        (' -1920 , 0 ', (-1920, 0)),
+        ('1_0,20,800,600', (10, 20, 800, 600)),
+    ])
+    def test_parse_position(self, text, expected):
+        """测试解析位置字符串（与 int() 规则一致）"""
+        from win_manager.cli.utils.helpers import parse_position
+
+        assert parse_position(text) == expected
+
+    @pytest.mark.parametrize('text,expected', [
+        ('800x600', (800, 600)),
+        ('800, 600', (800, 600)),
+        (' 1_024 x 768 ', (1024, 768)),
+    ])
+    def test_parse_size(self, text, expected):
+        """测试解析大小字符串（与 int() 规则一致）"""
+        from win_manager.cli.utils.helpers import parse_size
+
+        assert parse_size(text) == expected
+
+    @pytest.mark.parametrize('text', ['100', '1,2,3', 'a,b', '1,,2'])
+    def test_parse_position_invalid(self, text):
+        """测试无效的位置字符串"""
+        from win_manager.cli.utils.helpers import parse_position
+
+        with pytest.raises(ValueError, match='无效的位置格式'):
+            parse_position(text)
+
+    @pytest.mark.parametrize('text', ['800', '800x600x1', '1,2x3', 'axb'])
+    def test_parse_size_invalid(self, text):
+        """测试无效的大小字符串"""
+        from win_manager.cli.utils.helpers import parse_size
+
+        with pytest.raises(ValueError, match='无效的大小格式'):
+            parse_size(text)
+
+
+class TestCLIConfigFile:
+    """CLI 配置文件测试"""
+
+    @pytest.mark.parametrize('content', ['just a string\n', '- a\n- b\n'])
+    def test_non_mapping_config_falls_back_to_defaults(self, tmp_path, capsys, content):
+        """测试配置文件内容不是映射时回退到默认配置"""
+        from win_manager.cli.config.cli_config import CLIConfig, _default_config
+
+        config_path = tmp_path / 'cli-config.yaml'
+        config_path.write_text(content, encoding='utf-8')
+
+        config = CLIConfig(str(config_path))
+
+        assert config.config == _default_config()
+        assert '警告' in capsys.readouterr().out
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -142,6 +142,59 @@ class TestConfigManager:
             # Set new nested value
             config.set('new.nested.key', 'test_value')
             assert config.get('new.nested.key') == 'test_value'
+
+    def test_get_reflects_changes(self):
+        """Test lookups see every kind of config change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ConfigManager(config_dir=temp_dir)
+
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+g'
+            config.set('hotkeys.grid_layout', 'ctrl+alt+x')
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+x'
+
+            config.update({'hotkeys': {'grid_layout': 'ctrl+alt+y'}})
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+y'
+
+            config.reset_to_default()
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+g'
+
+            assert config.get('missing.key', 1) == 1
+            assert config.get('missing.key', 2) == 2
+            
+            # Direct mutation of the tree, or of a dict returned by get()
+            config.config['hotkeys']['grid_layout'] = 'ctrl+alt+d'
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+d'
+            config.get('hotkeys')['grid_layout'] = 'ctrl+alt+e'
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+e'
+            config.config['hotkeys'] = {'grid_layout': 'ctrl+alt+f'}
+            assert config.get('hotkeys.grid_layout') == 'ctrl+alt+f'
+
+    def test_update_config_values(self):
+        """Test setting several top-level values at once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ConfigManager(config_dir=temp_dir)
+            
+            config.update({
+                'window_management': {'default_layout': 'grid'},
+                'new_section': {'key': 'value'}
+            })
+            
+            assert config.get('window_management.default_layout') == 'grid'
+            assert config.get('new_section.key') == 'value'
+            # Untouched sections are preserved
+            assert config.get('filters.ignore_fixed_size') == True
+    
+    def test_update_config_dotted_keys(self):
+        """Test dotted keys in update() set nested values."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ConfigManager(config_dir=temp_dir)
+            
+            config.update({'window_management.default_layout': 'stack'})
+            
+            assert config.get('window_management.default_layout') == 'stack'
+            assert 'window_management.default_layout' not in config.config
+            # Sibling keys in the same section are preserved
+            assert config.get('window_management.grid_padding') == 10
     
     def test_excluded_processes(self):
         """Test excluded processes management."""
@@ -285,6 +338,9 @@ class TestConfigManager:
             assert merged['section1']['key4'] == 'user4'  # User addition
             assert merged['section2']['key3'] == 'default3'  # Default section preserved
             assert merged['section3']['key5'] == 'user5'  # User section added
+            # Inputs are left untouched
+            assert default['section1'] == {'key1': 'default1', 'key2': 'default2'}
+            assert 'section3' not in default
 
 
 if __name__ == '__main__':
@@ -63,7 +63,7 @@ class TestExceptionHandler:
         handler.handle_exception(test_exception, "test_context")
         
         logger.error.assert_called_once_with("Exception in test_context: Test error")
-        logger.debug.assert_called_once()
+        logger.debug.assert_called_once_with("Traceback", exc_info=test_exception)
     
     def test_handle_exception_with_callbacks(self):
         """Test exception handling with callbacks."""
@@ -409,7 +409,7 @@ class TestLogExceptions:
             test_func()
         
         logger.error.assert_called_once_with("Exception in test_func: Test error")
-        logger.debug.assert_called_once()
+        logger.debug.assert_called_once_with("Traceback", exc_info=True)
     
     def test_log_exceptions_no_logger(self):
         """Test log_exceptions decorator without logger."""
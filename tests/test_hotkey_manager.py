@@ -6,9 +6,7 @@ import pytest
 import os
 import sys
 import logging
-import threading
-import time
-from unittest.mock import patch, MagicMock, Mock, call
+from unittest.mock import patch, MagicMock, Mock
 
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -24,7 +22,6 @@ class TestHotkeyManager:
         manager = HotkeyManager()
         assert manager.hotkeys == {}
         assert manager.listener is None
-        assert manager.pressed_keys == set()
         assert manager.logger is not None
         assert manager.running == False
     
@@ -158,7 +155,7 @@ class TestHotkeyManager:
             result = manager.unregister_hotkey("ctrl+a")
             assert result == False
     
-    @patch('win_manager.utils.hotkey_manager.Listener')
+    @patch('win_manager.utils.hotkey_manager.GlobalHotKeys')
     def test_start_success(self, mock_listener_class):
         """Test successful hotkey manager start."""
         manager = HotkeyManager()
@@ -175,7 +172,7 @@ class TestHotkeyManager:
         mock_listener_class.assert_called_once()
         mock_listener.start.assert_called_once()
     
-    @patch('win_manager.utils.hotkey_manager.Listener')
+    @patch('win_manager.utils.hotkey_manager.GlobalHotKeys')
     def test_start_already_running(self, mock_listener_class):
         """Test starting hotkey manager when already running."""
         manager = HotkeyManager()
@@ -186,7 +183,7 @@ class TestHotkeyManager:
         assert result == True
         mock_listener_class.assert_not_called()
     
-    @patch('win_manager.utils.hotkey_manager.Listener')
+    @patch('win_manager.utils.hotkey_manager.GlobalHotKeys')
     def test_start_exception(self, mock_listener_class):
         """Test hotkey manager start with exception."""
         manager = HotkeyManager()
@@ -207,14 +204,12 @@ class TestHotkeyManager:
         manager.running = True
         mock_listener = Mock()
         manager.listener = mock_listener
-        manager.pressed_keys = {"ctrl", "a"}
         
         result = manager.stop()
         
         assert result == True
         assert manager.running == False
         assert manager.listener is None
-        assert manager.pressed_keys == set()
         mock_listener.stop.assert_called_once()
     
     def test_stop_not_running(self):
@@ -239,156 +234,46 @@ class TestHotkeyManager:
         # When exception occurs, cleanup doesn't happen
         assert manager.running == True
     
-    def test_key_to_string_keycode_with_char(self):
-        """Test converting KeyCode with character to string."""
+    def test_to_pynput_hotkey(self):
+        """Test converting parsed hotkeys to pynput's hotkey format."""
         manager = HotkeyManager()
         
-        # Mock KeyCode with character
-        from pynput.keyboard import KeyCode
-        key = KeyCode(char='a')
-        
-        result = manager._key_to_string(key)
-        assert result == 'a'
-    
-    def test_key_to_string_keycode_without_char(self):
-        """Test converting KeyCode without character to string."""
-        manager = HotkeyManager()
-        
-        # Mock KeyCode without character
-        from pynput.keyboard import KeyCode
-        key = KeyCode(vk=65)  # 'A' key
-        
-        result = manager._key_to_string(key)
-        assert result == 'key_65'
+        assert manager._to_pynput_hotkey("a+alt+ctrl") == "a+<alt>+<ctrl>"
+        assert manager._to_pynput_hotkey("c+win") == "c+<cmd>"
+        assert manager._to_pynput_hotkey("f1+shift") == "<f1>+<shift>"
+        assert manager._to_pynput_hotkey("ctrl+key_65") == "<ctrl>+<65>"
     
-    def test_key_to_string_special_keys(self):
-        """Test converting special Key objects to string."""
+    @patch('win_manager.utils.hotkey_manager.GlobalHotKeys')
+    def test_start_binds_hotkeys(self, mock_global_hotkeys):
+        """Test start hands registered hotkeys to GlobalHotKeys."""
         manager = HotkeyManager()
-        
-        # Mock Key objects by creating mock objects that pass isinstance check
-        from pynput.keyboard import Key
-        
-        # Test control keys by patching the method to test its logic
-        with patch.object(manager, '_key_to_string') as mock_method:
-            mock_method.return_value = 'ctrl'
-            result = manager._key_to_string(Key.ctrl_l)
-            assert result == 'ctrl'
-        
-        # Test the actual logic by creating a real Key-like object
-        # We'll test the key mapping logic directly
-        key_mapping = {
-            'ctrl_l': 'ctrl',
-            'ctrl_r': 'ctrl',
-            'alt_l': 'alt',
-            'alt_r': 'alt',
-            'shift_l': 'shift',
-            'shift_r': 'shift',
-            'cmd': 'win',
-            'cmd_l': 'win',
-            'cmd_r': 'win'
-        }
-        
-        # Test that the mapping works
-        for key_name, expected in key_mapping.items():
-            assert key_mapping.get(key_name) == expected
-    
-    def test_key_to_string_exception(self):
-        """Test key to string conversion with exception."""
-        manager = HotkeyManager()
-        
-        # Mock key object that raises exception
-        mock_key = Mock()
-        mock_key.char = property(lambda self: 1/0)  # Raises ZeroDivisionError
-        
-        result = manager._key_to_string(mock_key)
-        assert result is None
-    
-    @patch('threading.Thread')
-    def test_on_press_hotkey_match(self, mock_thread):
-        """Test key press handling with hotkey match."""
-        manager = HotkeyManager()
-        
-        # Register a hotkey
         callback = Mock()
-        manager.register_hotkey("ctrl+a", callback)
+        manager.register_hotkey("ctrl+alt+o", callback)
         
-        # Mock keys
-        from pynput.keyboard import Key, KeyCode
-        
-        # Press ctrl first
-        with patch.object(manager, '_key_to_string', return_value='ctrl'):
-            manager._on_press(Key.ctrl)
-        
-        # Press 'a' second
-        with patch.object(manager, '_key_to_string', return_value='a'):
-            manager._on_press(KeyCode(char='a'))
-        
-        # Should have started a thread to execute callback
-        mock_thread.assert_called_once()
-        assert mock_thread.call_args[1]['target'] == callback
-        assert mock_thread.call_args[1]['daemon'] == True
-    
-    def test_on_press_no_match(self):
-        """Test key press handling without hotkey match."""
-        manager = HotkeyManager()
-        
-        # No hotkeys registered
-        from pynput.keyboard import KeyCode
-        
-        with patch.object(manager, '_key_to_string', return_value='a'):
-            manager._on_press(KeyCode(char='a'))
-        
-        # Should add to pressed keys but not execute anything
-        assert 'a' in manager.pressed_keys
-    
-    def test_on_press_exception(self):
-        """Test key press handling with exception."""
-        manager = HotkeyManager()
-        
-        # Mock _key_to_string to raise exception
-        with patch.object(manager, '_key_to_string', side_effect=Exception("Test error")):
-            manager._on_press(Mock())
-        
-        # Should not crash
-        assert True
-    
-    def test_on_release(self):
-        """Test key release handling."""
-        manager = HotkeyManager()
-        
-        # Add key to pressed keys
-        manager.pressed_keys.add('a')
-        
-        from pynput.keyboard import KeyCode
-        
-        with patch.object(manager, '_key_to_string', return_value='a'):
-            manager._on_release(KeyCode(char='a'))
-        
-        # Should remove from pressed keys
-        assert 'a' not in manager.pressed_keys
-    
-    def test_on_release_key_not_pressed(self):
-        """Test releasing key that wasn't pressed."""
-        manager = HotkeyManager()
+        assert manager.start() == True
         
-        from pynput.keyboard import KeyCode
+        bindings = mock_global_hotkeys.call_args[0][0]
+        assert list(bindings) == ["<alt>+<ctrl>+o"]
         
-        with patch.object(manager, '_key_to_string', return_value='a'):
-            manager._on_release(KeyCode(char='a'))
+        # Callbacks run on the worker pool, not pynput's listener thread
+        bindings["<alt>+<ctrl>+o"]().result(timeout=1)
+        callback.assert_called_once()
         
-        # Should not crash
-        assert True
+        manager.stop()
+        assert manager._pool is None
     
-    def test_on_release_exception(self):
-        """Test key release handling with exception."""
+    @patch('win_manager.utils.hotkey_manager.GlobalHotKeys')
+    def test_register_while_running_reloads_listener(self, mock_global_hotkeys):
+        """Test hotkeys registered after start are picked up."""
         manager = HotkeyManager()
+        manager.start()
+        first_listener = manager.listener
         
-        # Mock _key_to_string to raise exception
-        with patch.object(manager, '_key_to_string', side_effect=Exception("Test error")):
-            manager._on_release(Mock())
+        manager.register_hotkey("ctrl+a", Mock())
         
-        # Should not crash
-        assert True
+        first_listener.stop.assert_called_once()
+        assert mock_global_hotkeys.call_count == 2
+        assert "a+<ctrl>" in mock_global_hotkeys.call_args[0][0]
     
     def test_get_registered_hotkeys(self):
         """Test getting registered hotkeys."""
@@ -350,6 +350,20 @@ class TestLayoutEngine:
         mock_get_metrics.assert_any_call(0)  # SM_CXSCREEN
         mock_get_metrics.assert_any_call(1)  # SM_CYSCREEN
     
+    @patch('win_manager.core.layout_manager.win32api.GetSystemMetrics')
+    def test_get_screen_rect_cached(self, mock_get_metrics):
+        """Test screen rectangle is cached until invalidated."""
+        engine = LayoutEngine()
+        mock_get_metrics.side_effect = [1920, 1080, 2560, 1440]
+        
+        assert engine.get_screen_rect() == (0, 0, 1920, 1080)
+        assert engine.get_screen_rect() == (0, 0, 1920, 1080)
+        assert mock_get_metrics.call_count == 2
+        
+        engine.invalidate_screen_cache()
+        assert engine.get_screen_rect() == (0, 0, 2560, 1440)
+        assert mock_get_metrics.call_count == 4
+    
     @patch('win_manager.core.layout_manager.win32api.GetSystemMetrics')
     def test_apply_layout_cascade(self, mock_get_metrics):
         """Test applying cascade layout."""
@@ -401,6 +415,25 @@ class TestLayoutEngine:
         assert len(positions) == 1
         assert 12345 in positions
     
+    @patch('win_manager.core.layout_manager.win32api.GetSystemMetrics')
+    def test_apply_layout_custom_options(self, mock_get_metrics):
+        """Test layouts built from custom options honour them."""
+        engine = LayoutEngine()
+        mock_get_metrics.side_effect = [1920, 1080]
+        
+        windows = [
+            WindowInfo(i, f"Window {i}", "test.exe", i, (0, 0, 100, 100), True, True)
+            for i in range(4)
+        ]
+        
+        grid = engine.apply_layout("grid", windows, columns=2, padding=0)
+        assert grid[1] == (960, 0, 960, 540)
+        assert engine.apply_layout("grid", windows, columns=2, padding=0) == grid
+        
+        stack = engine.apply_layout("stack", windows, stack_position="left",
+                                    window_width={'type': 'pixels', 'value': 800})
+        assert stack[0] == (50, 50, 800, 864)
+    
     def test_apply_layout_unknown(self):
         """Test applying unknown layout raises error."""
         engine = LayoutEngine()
@@ -5,7 +5,7 @@ Unit tests for WindowController.
 import pytest
 import os
 import sys
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, call
 
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -162,6 +162,58 @@ class TestWindowController:
         
         assert result == False
     
+    @patch('win_manager.core.window_controller.win32gui.EndDeferWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.DeferWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.BeginDeferWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.SetWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.IsIconic', return_value=False)
+    @patch('win_manager.core.window_controller.win32con.HWND_TOP', 0)
+    @patch('win_manager.core.window_controller.win32con.SWP_SHOWWINDOW', 0x40)
+    def test_deferred_moves_batched(self, mock_is_iconic, mock_set_pos, mock_begin,
+                                    mock_defer, mock_end):
+        """Test moves between begin/end are applied in one deferred batch."""
+        controller = WindowController()
+        mock_begin.return_value = "hdwp0"
+        mock_defer.side_effect = ["hdwp1", "hdwp2"]
+        
+        with patch.object(controller, 'save_window_state'):
+            controller.begin_deferred_moves(2)
+            assert controller.move_window(1, 0, 0, 300, 400) == True
+            assert controller.move_window(2, 30, 30, 300, 400) == True
+            assert controller.end_deferred_moves() == True
+        
+        mock_begin.assert_called_once_with(2)
+        mock_defer.assert_any_call("hdwp0", 1, 0, 0, 0, 300, 400, 0x40)
+        mock_defer.assert_any_call("hdwp1", 2, 0, 30, 30, 300, 400, 0x40)
+        mock_end.assert_called_once_with("hdwp2")
+        mock_set_pos.assert_not_called()
+    
+    @patch('win_manager.core.window_controller.win32gui.EndDeferWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.DeferWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.BeginDeferWindowPos', return_value="hdwp0")
+    @patch('win_manager.core.window_controller.win32gui.SetWindowPos')
+    @patch('win_manager.core.window_controller.win32gui.IsIconic', return_value=False)
+    @patch('win_manager.core.window_controller.win32con.HWND_TOP', 0)
+    @patch('win_manager.core.window_controller.win32con.SWP_SHOWWINDOW', 0x40)
+    def test_deferred_moves_fallback(self, mock_is_iconic, mock_set_pos, mock_begin,
+                                     mock_defer, mock_end):
+        """Test a failed deferral falls back to moving windows directly."""
+        controller = WindowController()
+        mock_defer.side_effect = ["hdwp1", Exception("API Error")]
+        
+        with patch.object(controller, 'save_window_state'):
+            controller.begin_deferred_moves(2)
+            assert controller.move_window(1, 0, 0, 300, 400) == True
+            assert controller.move_window(2, 30, 30, 300, 400) == True
+            assert controller.end_deferred_moves() == False
+        
+        # Queued move replayed, then the failing one applied directly
+        assert mock_set_pos.call_args_list == [
+            call(1, 0, 0, 0, 300, 400, 0x40),
+            call(2, 0, 30, 30, 300, 400, 0x40),
+        ]
+        mock_end.assert_not_called()
+    
     @patch('win_manager.core.window_controller.win32gui.SetForegroundWindow')
     def test_bring_to_front_success(self, mock_set_foreground):
         """Test successful bring to front."""
@@ -351,6 +403,19 @@ class TestWindowController:
         
         assert result == False
     
+    @patch('win_manager.core.window_controller.win32gui.GetWindowPlacement')
+    def test_get_window_show_state(self, mock_get_placement):
+        """Test reading the window show state from a single placement call."""
+        controller = WindowController()
+        
+        mock_get_placement.return_value = (0, 2, 0, (0, 0), (0, 0), (0, 0, 100, 100))
+        
+        assert controller.get_window_show_state(12345) == 2
+        mock_get_placement.assert_called_once_with(12345)
+        
+        mock_get_placement.side_effect = Exception("API Error")
+        assert controller.get_window_show_state(12345) is None
+    
     def test_window_state_persistence(self):
         """Test that window states are properly maintained."""
         controller = WindowController()
@@ -42,6 +42,13 @@ class TestWindowDetector:
         assert window_info.rect == (0, 0, 100, 100)
         assert window_info.is_visible == True
         assert window_info.is_resizable == True
+        assert window_info.class_name == 'N/A'
+        assert window_info.style == 'N/A'
+    
+    def test_window_info_has_no_instance_dict(self):
+        """Test WindowInfo instances stay compact (no per-instance __dict__)."""
+        window_info = WindowInfo(1, "Test", "test.exe", 1, (0, 0, 1, 1), True, True)
+        assert not hasattr(window_info, '__dict__')
     
     @patch('win_manager.core.window_detector.win32gui.EnumWindows')
     def test_enumerate_windows(self, mock_enum_windows):
@@ -109,16 +116,36 @@ class TestWindowDetector:
         assert window.is_resizable == True
     
     @patch('win_manager.core.window_detector.win32gui.IsWindowVisible')
-    def test_enum_windows_callback_invisible(self, mock_is_visible):
-        """Test callback with invisible window."""
+    def test_collect_visible_hwnd_skips_invisible(self, mock_is_visible):
+        """Test invisible windows are dropped while collecting handles."""
+        mock_is_visible.side_effect = lambda hwnd: hwnd == 1
+        hwnds = []
+        
+        assert WindowDetector._collect_visible_hwnd(1, hwnds) == True
+        assert WindowDetector._collect_visible_hwnd(2, hwnds) == True
+        
+        assert hwnds == [1]
+    
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect', return_value=(0, 0, 100, 100))
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText', return_value="Test Window")
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible', return_value=True)
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_windows_checks_visibility_once(self, mock_enum_windows, mock_is_visible,
+                                                      mock_get_text, mock_get_rect,
+                                                      mock_get_thread_pid):
+        """Test collected handles are not checked for visibility a second time."""
         detector = WindowDetector()
         
-        mock_is_visible.return_value = False
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in (1, 2)]
+        mock_get_thread_pid.return_value = (1111, 2222)
         
-        result = detector._enum_windows_callback(12345, None)
+        with patch.object(detector, '_snapshot_process_names', return_value={2222: 'test.exe'}), \
+             patch.object(detector, '_is_window_resizable', return_value=True):
+            windows = detector.enumerate_windows()
         
-        assert result == True
-        assert len(detector.windows) == 0
+        assert [w.hwnd for w in windows] == [1, 2]
+        assert mock_is_visible.call_count == 2
     
     @patch('win_manager.core.window_detector.win32gui.GetWindowText')
     @patch('win_manager.core.window_detector.win32gui.IsWindowVisible')
@@ -160,6 +187,144 @@ class TestWindowDetector:
         assert result == True
         assert len(detector.windows) == 0
     
+    @patch('win_manager.core.window_detector.psutil.process_iter', return_value=[])
+    @patch('win_manager.core.window_detector.psutil.Process')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText')
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible')
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_windows_looks_up_each_pid_once(self, mock_enum_windows, mock_is_visible,
+                                                      mock_get_text, mock_get_rect,
+                                                      mock_get_thread_pid, mock_process,
+                                                      mock_process_iter):
+        """Test process names are resolved once per PID during enumeration."""
+        detector = WindowDetector()
+        
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in (1, 2, 3)]
+        mock_is_visible.return_value = True
+        mock_get_text.return_value = "Test Window"
+        mock_get_rect.return_value = (0, 0, 100, 100)
+        mock_get_thread_pid.return_value = (1111, 2222)
+        mock_process.return_value.name.return_value = "test.exe"
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True):
+            windows = detector.enumerate_windows()
+        
+        assert [w.hwnd for w in windows] == [1, 2, 3]
+        assert all(w.process_name == "test.exe" for w in windows)
+        mock_process.assert_called_once_with(2222)
+    
+    @patch('win_manager.core.window_detector.psutil.process_iter')
+    @patch('win_manager.core.window_detector.psutil.Process')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText')
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible')
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_windows_uses_process_snapshot(self, mock_enum_windows, mock_is_visible,
+                                                     mock_get_text, mock_get_rect,
+                                                     mock_get_thread_pid, mock_process,
+                                                     mock_process_iter):
+        """Test process names come from one process sweep during enumeration."""
+        detector = WindowDetector()
+        
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in (1, 2)]
+        mock_is_visible.return_value = True
+        mock_get_text.return_value = "Test Window"
+        mock_get_rect.return_value = (0, 0, 100, 100)
+        mock_get_thread_pid.side_effect = [(1111, 2222), (1111, 3333)]
+        mock_process_iter.return_value = [
+            Mock(pid=2222, info={'name': 'test.exe'}),
+            Mock(pid=3333, info={'name': None}),  # access denied
+        ]
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True):
+            windows = detector.enumerate_windows()
+        
+        assert [(w.hwnd, w.process_name) for w in windows] == [(1, "test.exe")]
+        mock_process_iter.assert_called_once_with(['name'])
+        mock_process.assert_not_called()
+    
+    @patch('win_manager.core.window_detector.psutil.process_iter')
+    @patch('win_manager.core.window_detector.psutil.Process')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText')
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible', return_value=True)
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_windows_title_filter(self, mock_enum_windows, mock_is_visible,
+                                            mock_get_text, mock_get_rect,
+                                            mock_get_thread_pid, mock_process,
+                                            mock_process_iter):
+        """Test a title filter skips lookups for non-matching windows."""
+        detector = WindowDetector()
+        
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in (1, 2, 3)]
+        mock_get_text.side_effect = ["Notepad", "Calculator", "Untitled - NOTEPAD"]
+        mock_get_rect.return_value = (0, 0, 100, 100)
+        mock_get_thread_pid.return_value = (1111, 2222)
+        mock_process.return_value.name.return_value = "notepad.exe"
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True):
+            windows = detector.enumerate_windows(title_substr="notepad")
+        
+        assert [w.hwnd for w in windows] == [1, 3]
+        assert mock_get_rect.call_count == 2
+        mock_process_iter.assert_not_called()
+        assert detector._title_filter is None
+    
+    @patch('win_manager.core.window_detector.psutil.process_iter')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText', return_value="Test Window")
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible', return_value=True)
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_windows_skips_excluded_processes(self, mock_enum_windows, mock_is_visible,
+                                                        mock_get_text, mock_get_rect,
+                                                        mock_get_thread_pid, mock_process_iter):
+        """Test excluded processes are dropped before rect and style lookups."""
+        detector = WindowDetector()
+        
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in (1, 2)]
+        mock_get_rect.return_value = (0, 0, 100, 100)
+        mock_get_thread_pid.side_effect = [(1111, 2222), (1111, 3333)]
+        mock_process_iter.return_value = [
+            Mock(pid=2222, info={'name': 'Explorer.EXE'}),
+            Mock(pid=3333, info={'name': 'test.exe'}),
+        ]
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True) as mock_resizable:
+            windows = detector.enumerate_windows(excluded_processes={'explorer.exe'})
+        
+        assert [w.hwnd for w in windows] == [2]
+        mock_get_rect.assert_called_once_with(2)
+        mock_resizable.assert_called_once_with(2)
+    
+    @patch('win_manager.core.window_detector.psutil.process_iter')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect', return_value=(0, 0, 100, 100))
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText')
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible')
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_enumerate_many_windows_keeps_order(self, mock_enum_windows, mock_is_visible,
+                                                mock_get_text, mock_get_rect,
+                                                mock_get_thread_pid, mock_process_iter):
+        """Test large window sets are built in parallel without losing order."""
+        detector = WindowDetector()
+        
+        mock_enum_windows.side_effect = lambda callback, param: [callback(h, param) for h in range(200)]
+        mock_is_visible.side_effect = lambda hwnd: hwnd % 2 == 0
+        mock_get_text.side_effect = lambda hwnd: f"Window {hwnd}"
+        mock_get_thread_pid.return_value = (1111, 2222)
+        mock_process_iter.return_value = [Mock(pid=2222, info={'name': 'test.exe'})]
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True):
+            windows = detector.enumerate_windows()
+        
+        assert [w.hwnd for w in windows] == list(range(0, 200, 2))
+        assert all(w.title == f"Window {w.hwnd}" for w in windows)
+    
     @patch('win_manager.core.window_detector.win32gui.GetWindowLong')
     @patch('win_manager.core.window_detector.win32con.GWL_STYLE', 123)
     @patch('win_manager.core.window_detector.win32con.WS_THICKFRAME', 0x40000)
@@ -190,6 +355,27 @@ class TestWindowDetector:
         assert result == False
         mock_get_long.assert_called_once_with(12345, 123)
     
+    @patch('win_manager.core.window_detector.time.monotonic')
+    @patch('win_manager.core.window_detector.win32gui.GetWindowLong')
+    @patch('win_manager.core.window_detector.win32con.GWL_STYLE', 123)
+    @patch('win_manager.core.window_detector.win32con.WS_THICKFRAME', 0x40000)
+    def test_is_window_resizable_cached(self, mock_get_long, mock_monotonic):
+        """Test style lookups are reused until the cache entry expires."""
+        detector = WindowDetector()
+        mock_get_long.return_value = 0x40000
+        
+        mock_monotonic.return_value = 100.0
+        assert detector._is_window_resizable(12345) == True
+        mock_monotonic.return_value = 100.2
+        assert detector._is_window_resizable(12345) == True
+        assert mock_get_long.call_count == 1
+        
+        # Expired entries are looked up again
+        mock_monotonic.return_value = 101.0
+        mock_get_long.return_value = 0
+        assert detector._is_window_resizable(12345) == False
+        assert mock_get_long.call_count == 2
+    
     @patch('win_manager.core.window_detector.win32gui.GetWindowLong')
     def test_is_window_resizable_exception(self, mock_get_long):
         """Test checking if window is resizable with exception."""
@@ -225,6 +411,20 @@ class TestWindowDetector:
         assert result.hwnd == 3
         assert result.process_name == "cmd.exe"
     
+    def test_get_window_by_title_reindexes_new_windows(self):
+        """Test title lookups follow a replaced window list."""
+        detector = WindowDetector()
+        detector.windows = [
+            WindowInfo(1, "Notepad", "notepad.exe", 100, (0, 0, 100, 100), True, True)
+        ]
+        assert detector.get_window_by_title("notepad").hwnd == 1
+        
+        detector.windows = [
+            WindowInfo(2, "Calculator", "calc.exe", 200, (0, 0, 200, 200), True, True)
+        ]
+        assert detector.get_window_by_title("notepad") is None
+        assert detector.get_window_by_title("CALC").hwnd == 2
+    
     def test_get_window_by_title_not_found(self):
         """Test finding window by title when not found."""
         detector = WindowDetector()
@@ -237,6 +437,57 @@ class TestWindowDetector:
         result = detector.get_window_by_title("NonExistentWindow")
         assert result is None
     
+    @patch('win_manager.core.window_detector.win32gui.IsWindow', return_value=True)
+    def test_get_window_by_hwnd_found(self, mock_is_window):
+        """Test looking up a single window by handle."""
+        detector = WindowDetector()
+        expected = WindowInfo(12345, "Test Window", "test.exe", 1234, (0, 0, 100, 100), True, True)
+        
+        with patch.object(detector, '_build_window_info', return_value=expected) as mock_build, \
+             patch.object(detector, '_enum_windows_callback') as mock_callback:
+            result = detector.get_window_by_hwnd(12345)
+        
+        assert result == expected
+        mock_build.assert_called_once_with(12345)
+        mock_callback.assert_not_called()
+    
+    @patch('win_manager.core.window_detector.psutil.Process')
+    @patch('win_manager.core.window_detector.win32process.GetWindowThreadProcessId', return_value=(1111, 2222))
+    @patch('win_manager.core.window_detector.win32gui.GetWindowRect', return_value=(0, 0, 100, 100))
+    @patch('win_manager.core.window_detector.win32gui.GetWindowText', return_value="Test Window")
+    @patch('win_manager.core.window_detector.win32gui.IsWindowVisible', return_value=True)
+    @patch('win_manager.core.window_detector.win32gui.IsWindow', return_value=True)
+    @patch('win_manager.core.window_detector.win32gui.EnumWindows')
+    def test_get_window_by_hwnd_does_not_cache_process_names(self, mock_enum_windows, mock_is_window,
+                                                             mock_is_visible, mock_get_text,
+                                                             mock_get_rect, mock_get_thread_pid,
+                                                             mock_process):
+        """Test single-window lookups never leak pid names into a later enumeration."""
+        detector = WindowDetector()
+        mock_process.return_value.name.return_value = "old.exe"
+        
+        with patch.object(detector, '_is_window_resizable', return_value=True):
+            assert detector.get_window_by_hwnd(1).process_name == "old.exe"
+            assert detector._pid_names == {}
+            
+            # The pid now belongs to another process
+            mock_process.return_value.name.return_value = "new.exe"
+            detector._pid_names = {2222: "stale.exe"}
+            mock_enum_windows.side_effect = lambda callback, param: callback(1, param)
+            windows = detector.enumerate_windows(title_substr="test")
+        
+        assert [w.process_name for w in windows] == ["new.exe"]
+    
+    @patch('win_manager.core.window_detector.win32gui.IsWindow', return_value=False)
+    def test_get_window_by_hwnd_invalid(self, mock_is_window):
+        """Test looking up an invalid window handle."""
+        detector = WindowDetector()
+        
+        with patch.object(detector, '_build_window_info') as mock_build:
+            assert detector.get_window_by_hwnd(99999) is None
+        
+        mock_build.assert_not_called()
+    
     def test_get_resizable_windows(self):
         """Test getting only resizable windows."""
         detector = WindowDetector()
@@ -165,6 +165,7 @@ class TestWindowManager:
             result = manager.organize_windows("cascade")
             
             assert result == True
+            mock_layout_engine_instance.invalidate_screen_cache.assert_called_once_with()
             mock_layout_engine_instance.apply_layout.assert_called_once_with("cascade", [
                 WindowInfo(1, "Window 1", "test1.exe", 100, (0, 0, 200, 200), True, True),
                 WindowInfo(2, "Window 2", "test2.exe", 200, (0, 0, 300, 300), True, True)
@@ -354,14 +355,11 @@ class TestWindowManager:
             
             # Mock detector
             mock_detector_instance = Mock()
-            mock_detector_instance.enumerate_windows.return_value = [
-                WindowInfo(1, "Window 1", "test1.exe", 100, (0, 0, 200, 200), True, True),
-                WindowInfo(2, "Window 2", "test2.exe", 200, (0, 0, 300, 300), True, True)
-            ]
             mock_detector.return_value = mock_detector_instance
             
-            # Mock controller
+            # Mock controller with two saved window states
             mock_controller_instance = Mock()
+            mock_controller_instance.window_states = {1: {}, 2: {}}
             mock_controller_instance.restore_window_state.return_value = True
             mock_controller.return_value = mock_controller_instance
             
@@ -370,6 +368,10 @@ class TestWindowManager:
             
             assert result == True
             assert mock_controller_instance.restore_window_state.call_count == 2
+            mock_controller_instance.restore_window_state.assert_any_call(1)
+            mock_controller_instance.restore_window_state.assert_any_call(2)
+            # Saved states already name the windows to restore
+            mock_detector_instance.enumerate_windows.assert_not_called()
     
     def test_undo_layout_no_success(self):
         """Test undo layout when no windows can be restored."""
@@ -383,15 +385,9 @@ class TestWindowManager:
             mock_config_instance.get.return_value = "INFO"
             mock_config.return_value = mock_config_instance
             
-            # Mock detector
-            mock_detector_instance = Mock()
-            mock_detector_instance.enumerate_windows.return_value = [
-                WindowInfo(1, "Window 1", "test1.exe", 100, (0, 0, 200, 200), True, True)
-            ]
-            mock_detector.return_value = mock_detector_instance
-            
             # Mock controller - restore fails
             mock_controller_instance = Mock()
+            mock_controller_instance.window_states = {1: {}}
             mock_controller_instance.restore_window_state.return_value = False
             mock_controller.return_value = mock_controller_instance
             
@@ -412,10 +408,11 @@ class TestWindowManager:
             mock_config_instance.get.return_value = "INFO"
             mock_config.return_value = mock_config_instance
             
-            # Mock detector - raise exception
-            mock_detector_instance = Mock()
-            mock_detector_instance.enumerate_windows.side_effect = Exception("Test error")
-            mock_detector.return_value = mock_detector_instance
+            # Mock controller - raise exception
+            mock_controller_instance = Mock()
+            mock_controller_instance.window_states = {1: {}}
+            mock_controller_instance.restore_window_state.side_effect = Exception("Test error")
+            mock_controller.return_value = mock_controller_instance
             
             manager = WindowManager()
             result = manager.undo_layout()
@@ -444,14 +441,18 @@ class TestWindowManager:
             
             # Mock controller
             mock_controller_instance = Mock()
-            mock_controller_instance.is_window_minimized.side_effect = [False, True]
-            mock_controller_instance.is_window_maximized.side_effect = [True, False]
+            # First window maximized (SW_SHOWMAXIMIZED), second minimized (SW_SHOWMINIMIZED)
+            mock_controller_instance.get_window_show_state.side_effect = [3, 2]
             mock_controller.return_value = mock_controller_instance
             
             manager = WindowManager()
             window_list = manager.get_window_list()
             
             assert len(window_list) == 2
+            assert list(window_list[0]) == [
+                'hwnd', 'title', 'process_name', 'pid', 'rect',
+                'is_visible', 'is_resizable', 'is_minimized', 'is_maximized'
+            ]
             
             # Check first window
             assert window_list[0]['hwnd'] == 1
@@ -467,6 +468,27 @@ class TestWindowManager:
             assert window_list[1]['is_minimized'] == True
             assert window_list[1]['is_maximized'] == False
     
+    def test_get_window_list_many_windows_keeps_order(self):
+        """Test window states stay paired with their windows for large lists."""
+        with patch('win_manager.core.window_manager.WindowDetector') as mock_detector, \
+             patch('win_manager.core.window_manager.WindowController') as mock_controller, \
+             patch('win_manager.core.window_manager.LayoutEngine'), \
+             patch('win_manager.core.window_manager.ConfigManager') as mock_config:
+            
+            mock_config.return_value.get.return_value = "INFO"
+            mock_detector.return_value.enumerate_windows.return_value = [
+                WindowInfo(i, f"Window {i}", "test.exe", i, (0, 0, 200, 200), True, True)
+                for i in range(64)
+            ]
+            mock_controller_instance = mock_controller.return_value
+            mock_controller_instance.get_window_show_state.side_effect = lambda hwnd: 2 + hwnd % 2
+            
+            window_list = WindowManager().get_window_list()
+            
+            assert [w['hwnd'] for w in window_list] == list(range(64))
+            assert all(w['is_minimized'] == (w['hwnd'] % 2 == 0) for w in window_list)
+            assert all(w['is_maximized'] == (w['hwnd'] % 2 == 1) for w in window_list)
+    
     def test_window_control_methods(self):
         """Test window control delegation methods."""
         with patch('win_manager.core.window_manager.WindowDetector'), \